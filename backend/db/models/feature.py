@@ -89,10 +89,10 @@ class FeatureSnapshot(Base):
     __tablename__ = "feature_snapshot"
     __table_args__ = (
         PrimaryKeyConstraint(
-            "run_id",
             "asset_id",
             "feature_id",
             "hour_ts_utc",
+            "run_id",
             name="pk_feature_snapshot",
         ),
         ForeignKeyConstraint(
@@ -115,6 +115,7 @@ class FeatureSnapshot(Base):
             "idx_feature_snapshot_asset_hour_desc",
             "asset_id",
             desc("hour_ts_utc"),
+            postgresql_include=["feature_value"],
         ),
         Index(
             "idx_feature_snapshot_feature_hour_desc",
@@ -126,6 +127,12 @@ class FeatureSnapshot(Base):
             "run_mode",
             desc("hour_ts_utc"),
         ),
+        Index(
+            "brin_feature_snapshot_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     run_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
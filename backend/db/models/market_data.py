@@ -69,7 +69,12 @@ class MarketOhlcvHourly(Base):
             "trade_count >= 0",
             name="ck_market_ohlcv_hourly_trade_count_nonneg",
         ),
-        Index("idx_market_ohlcv_hour_desc", desc("hour_ts_utc")),
+        Index(
+            "brin_market_ohlcv_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     asset_id: Mapped[int] = mapped_column(
@@ -146,7 +151,12 @@ class OrderBookSnapshot(Base):
             "asset_id",
             desc("hour_ts_utc"),
         ),
-        Index("idx_order_book_hour_desc", desc("hour_ts_utc")),
+        Index(
+            "brin_order_book_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     asset_id: Mapped[int] = mapped_column(
@@ -174,14 +184,6 @@ class OrderBookSnapshot(Base):
         Computed("best_ask_price - best_bid_price", persisted=True),
         nullable=False,
     )
-    spread_bps: Mapped[Decimal] = mapped_column(
-        Numeric(12, 8),
-        Computed(
-            "((best_ask_price - best_bid_price) / NULLIF(best_bid_price, 0)) * 10000::numeric",
-            persisted=True,
-        ),
-        nullable=False,
-    )
     source_venue: Mapped[str] = mapped_column(Text, nullable=False, primary_key=True)
     ingest_run_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -128,6 +128,12 @@ class RegimeOutput(Base):
             "asset_id",
             desc("hour_ts_utc"),
         ),
+        Index(
+            "brin_regime_output_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     run_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
@@ -266,10 +272,11 @@ class ModelPrediction(Base):
             name="ck_model_prediction_prob_range",
         ),
         Index(
-            "idx_model_prediction_asset_hour_horizon",
+            "idx_model_prediction_asset_horizon_hour",
             "asset_id",
-            desc("hour_ts_utc"),
             "horizon",
+            desc("hour_ts_utc"),
+            postgresql_include=["prob_up", "expected_return", "model_role", "model_version_id"],
         ),
         Index(
             "idx_model_prediction_role_hour_desc",
@@ -284,6 +291,13 @@ class ModelPrediction(Base):
             "hour_ts_utc",
             unique=True,
             postgresql_where=text("model_role = 'META'"),
+            postgresql_include=["prob_up", "expected_return", "model_version_id"],
+        ),
+        Index(
+            "brin_model_prediction_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
         ),
     )
 
@@ -390,9 +404,11 @@ class MetaLearnerComponent(Base):
             desc("hour_ts_utc"),
         ),
         Index(
-            "idx_meta_component_asset_hour_desc",
+            "idx_meta_component_asset_horizon_hour",
             "asset_id",
+            "horizon",
             desc("hour_ts_utc"),
+            postgresql_include=["base_prob_up", "component_weight"],
         ),
     )
 
@@ -55,13 +55,26 @@ class ModelVersion(Base):
             "length(btrim(mlflow_run_id)) > 0",
             name="ck_model_version_mlflow_run_id_not_blank",
         ),
-        Index("idx_model_version_role_active", "model_role", "is_active"),
+        Index(
+            "idx_model_version_active_by_role",
+            "model_role",
+            postgresql_where=text("is_active = TRUE"),
+            postgresql_include=["model_version_id", "model_name"],
+        ),
         Index(
             "uqix_model_version_one_active_per_name_role",
             "model_name",
             "model_role",
             unique=True,
             postgresql_where=text("is_active = TRUE"),
+            postgresql_include=[
+                "model_version_id",
+                "mlflow_model_uri",
+                "mlflow_run_id",
+                "feature_set_version",
+                "hyperparams_hash",
+                "training_data_hash",
+            ],
         ),
     )
 
@@ -125,6 +138,7 @@ class ModelTrainingWindow(Base):
             "valid_start_utc",
             "valid_end_utc",
         ),
+        Index("idx_model_training_window_model_version", "model_version_id"),
     )
 
     training_window_id: Mapped[int] = mapped_column(
@@ -175,7 +189,14 @@ class ModelActivationGate(Base):
             "run_mode",
             unique=True,
             postgresql_where=text("status = 'APPROVED'"),
-        ),
+            postgresql_include=[
+                "activation_id",
+                "validation_backtest_run_id",
+                "validation_window_end_utc",
+                "approval_hash",
+            ],
+        ),
+        Index("idx_model_activation_gate_model_version", "model_version_id"),
     )
 
     activation_id: Mapped[int] = mapped_column(
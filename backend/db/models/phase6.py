@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import uuid
 from datetime import date, datetime
 from decimal import Decimal
 
@@ -97,7 +98,7 @@ class IngestionCycle(Base):
         ),
     )
 
-    ingestion_cycle_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    ingestion_cycle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     cycle_kind: Mapped[str] = mapped_column(Text, nullable=False)
     started_at_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     completed_at_utc: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -125,8 +126,8 @@ class IngestionWatermarkHistory(Base):
     )
 
     watermark_id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), nullable=False)
-    ingestion_cycle_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    ingestion_cycle_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey(
             "ingestion_cycle.ingestion_cycle_id",
             name="fk_ingestion_watermark_cycle",
@@ -164,8 +165,8 @@ class RawTradeChunkManifest(Base):
     )
 
     chunk_manifest_id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), nullable=False)
-    ingestion_cycle_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    ingestion_cycle_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey(
             "ingestion_cycle.ingestion_cycle_id",
             name="fk_raw_trade_chunk_cycle",
@@ -202,7 +203,7 @@ class DataGapEvent(Base):
         ),
     )
 
-    gap_event_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    gap_event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     source_name: Mapped[str] = mapped_column(Text, nullable=False)
     symbol: Mapped[str] = mapped_column(Text, nullable=False)
     gap_start_ts_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -225,7 +226,7 @@ class DatasetSnapshot(Base):
         CheckConstraint("symbol_count > 0", name="ck_dataset_snapshot_symbol_count"),
     )
 
-    dataset_snapshot_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    dataset_snapshot_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     generated_at_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     dataset_hash: Mapped[str] = mapped_column(CHAR(64), nullable=False)
     row_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -250,8 +251,8 @@ class DatasetSnapshotComponent(Base):
         CheckConstraint("component_row_count >= 0", name="ck_dataset_component_row_count"),
     )
 
-    dataset_snapshot_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    dataset_snapshot_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey(
             "dataset_snapshot.dataset_snapshot_id",
             name="fk_dataset_component_snapshot",
@@ -287,7 +288,7 @@ class TrainingCycle(Base):
         ),
     )
 
-    training_cycle_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    training_cycle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     cycle_kind: Mapped[str] = mapped_column(Text, nullable=False)
     started_at_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     completed_at_utc: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -308,8 +309,8 @@ class ModelTrainingRun(Base):
         ),
     )
 
-    training_cycle_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    training_cycle_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey(
             "training_cycle.training_cycle_id",
             name="fk_model_training_run_cycle",
@@ -318,8 +319,8 @@ class ModelTrainingRun(Base):
         ),
         nullable=False,
     )
-    dataset_snapshot_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    dataset_snapshot_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey(
             "dataset_snapshot.dataset_snapshot_id",
             name="fk_model_training_run_snapshot",
@@ -360,8 +361,8 @@ class HindcastForecastMetric(Base):
     )
 
     metric_id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), nullable=False)
-    training_cycle_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    training_cycle_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey(
             "training_cycle.training_cycle_id",
             name="fk_hindcast_cycle",
@@ -392,7 +393,7 @@ class DriftEvent(Base):
         CheckConstraint("psi_value >= 0", name="ck_drift_psi_nonneg"),
     )
 
-    drift_event_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    drift_event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     training_cycle_ref: Mapped[str] = mapped_column(Text, nullable=False)
     symbol: Mapped[str] = mapped_column(Text, nullable=False)
     horizon: Mapped[str] = mapped_column(horizon_enum, nullable=False)
@@ -412,9 +413,9 @@ class PromotionDecision(Base):
         PrimaryKeyConstraint("promotion_decision_id", name="pk_promotion_decision"),
     )
 
-    promotion_decision_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
-    training_cycle_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    promotion_decision_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    training_cycle_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey(
             "training_cycle.training_cycle_id",
             name="fk_promotion_decision_cycle",
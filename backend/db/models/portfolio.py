@@ -43,9 +43,14 @@ class PortfolioHourlyState(Base):
             name="pk_portfolio_hourly_state",
         ),
         ForeignKeyConstraint(
-            ["source_run_id", "run_mode", "hour_ts_utc"],
-            ["run_context.run_id", "run_context.run_mode", "run_context.hour_ts_utc"],
-            name="fk_portfolio_hourly_state_run_context",
+            ["source_run_id", "account_id", "run_mode", "hour_ts_utc"],
+            [
+                "run_context.run_id",
+                "run_context.account_id",
+                "run_context.run_mode",
+                "run_context.hour_ts_utc",
+            ],
+            name="fk_portfolio_hourly_state_run_context_account_hour",
             onupdate="RESTRICT",
             ondelete="RESTRICT",
         ),
@@ -100,6 +105,12 @@ class PortfolioHourlyState(Base):
             postgresql_where=text("halted = TRUE"),
         ),
         Index("idx_portfolio_hourly_source_run_id", "source_run_id"),
+        Index(
+            "brin_portfolio_hourly_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     run_mode: Mapped[str] = mapped_column(run_mode_enum, primary_key=True)
@@ -149,9 +160,14 @@ class PositionHourlyState(Base):
             name="pk_position_hourly_state",
         ),
         ForeignKeyConstraint(
-            ["source_run_id", "run_mode", "hour_ts_utc"],
-            ["run_context.run_id", "run_context.run_mode", "run_context.hour_ts_utc"],
-            name="fk_position_hourly_state_run_context",
+            ["source_run_id", "account_id", "run_mode", "hour_ts_utc"],
+            [
+                "run_context.run_id",
+                "run_context.account_id",
+                "run_context.run_mode",
+                "run_context.hour_ts_utc",
+            ],
+            name="fk_position_hourly_state_run_context_account_hour",
             onupdate="RESTRICT",
             ondelete="RESTRICT",
         ),
@@ -194,6 +210,12 @@ class PositionHourlyState(Base):
             desc("hour_ts_utc"),
         ),
         Index("idx_position_hourly_source_run_id", "source_run_id"),
+        Index(
+            "brin_position_hourly_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     run_mode: Mapped[str] = mapped_column(run_mode_enum, primary_key=True)
@@ -77,13 +77,6 @@ class RiskHourlyState(Base):
             onupdate="RESTRICT",
             ondelete="RESTRICT",
         ),
-        ForeignKeyConstraint(
-            ["source_run_id", "run_mode", "hour_ts_utc"],
-            ["run_context.run_id", "run_context.run_mode", "run_context.hour_ts_utc"],
-            name="fk_risk_hourly_state_run_context",
-            onupdate="RESTRICT",
-            ondelete="RESTRICT",
-        ),
         CheckConstraint(
             "date_trunc('hour', hour_ts_utc) = hour_ts_utc",
             name="ck_risk_hourly_state_hour_aligned",
@@ -150,7 +143,25 @@ class RiskHourlyState(Base):
             desc("hour_ts_utc"),
             postgresql_where=text("halt_new_entries = TRUE"),
         ),
+        Index(
+            "idx_risk_hourly_kill_switch_true_hour_desc",
+            "account_id",
+            desc("hour_ts_utc"),
+            postgresql_where=text("kill_switch_active = TRUE"),
+        ),
+        Index(
+            "idx_risk_hourly_manual_review_true_hour_desc",
+            "account_id",
+            desc("hour_ts_utc"),
+            postgresql_where=text("requires_manual_review = TRUE"),
+        ),
         Index("idx_risk_hourly_source_run_id", "source_run_id"),
+        Index(
+            "brin_risk_hourly_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     run_mode: Mapped[str] = mapped_column(run_mode_enum, nullable=False)
@@ -283,6 +294,12 @@ class ClusterExposureHourlyState(Base):
             "cluster_id",
             desc("hour_ts_utc"),
         ),
+        Index(
+            "brin_cluster_exposure_hourly_hour",
+            "hour_ts_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     run_mode: Mapped[str] = mapped_column(run_mode_enum, nullable=False)
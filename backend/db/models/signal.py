@@ -22,6 +22,7 @@ from sqlalchemy import (
     UniqueConstraint,
     Text,
     desc,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -154,9 +155,10 @@ class TradeSignal(Base):
             name="ck_trade_signal_exit_direction",
         ),
         Index(
-            "idx_trade_signal_action_hour_desc",
+            "idx_trade_signal_enter_exit_hour_desc",
             "action",
             desc("hour_ts_utc"),
+            postgresql_where=text("action IN ('ENTER', 'EXIT')"),
         ),
         Index(
             "idx_trade_signal_account_hour_desc",
@@ -0,0 +1,53 @@
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+DO $$
+DECLARE
+    pk_columns name[];
+BEGIN
+    SELECT array_agg(a.attname ORDER BY k.ord)
+    INTO pk_columns
+    FROM pg_constraint c
+    CROSS JOIN LATERAL unnest(c.conkey) WITH ORDINALITY AS k(attnum, ord)
+    JOIN pg_attribute a
+      ON a.attrelid = c.conrelid
+     AND a.attnum = k.attnum
+    WHERE c.conrelid = 'feature_snapshot'::regclass
+      AND c.conname = 'pk_feature_snapshot';
+
+    IF pk_columns = ARRAY['asset_id', 'feature_id', 'hour_ts_utc', 'run_id']::name[] THEN
+        RETURN;
+    END IF;
+
+    -- TimescaleDB rejects ADD CONSTRAINT ... USING INDEX on hypertables, so a
+    -- migrated hypertable rebuilds the key in one ALTER TABLE instead.
+    IF to_regclass('timescaledb_information.hypertables') IS NOT NULL
+       AND EXISTS (
+           SELECT 1
+           FROM timescaledb_information.hypertables
+           WHERE hypertable_name = 'feature_snapshot'
+       ) THEN
+        ALTER TABLE feature_snapshot
+            DROP CONSTRAINT pk_feature_snapshot,
+            ADD CONSTRAINT pk_feature_snapshot PRIMARY KEY (asset_id, feature_id, hour_ts_utc, run_id);
+        RETURN;
+    END IF;
+
+    CREATE UNIQUE INDEX pk_feature_snapshot_series_order
+        ON feature_snapshot (asset_id, feature_id, hour_ts_utc, run_id);
+    ALTER TABLE feature_snapshot
+        DROP CONSTRAINT pk_feature_snapshot,
+        ADD CONSTRAINT pk_feature_snapshot PRIMARY KEY USING INDEX pk_feature_snapshot_series_order;
+END
+$$;
+
+COMMIT;
+
+SELECT
+    'feature_snapshot_primary_key_column_order' AS check_name,
+    COUNT(*) AS violations
+FROM pg_constraint
+WHERE conrelid = 'feature_snapshot'::regclass
+  AND conname = 'pk_feature_snapshot'
+  AND pg_get_constraintdef(oid) <> 'PRIMARY KEY (asset_id, feature_id, hour_ts_utc, run_id)';
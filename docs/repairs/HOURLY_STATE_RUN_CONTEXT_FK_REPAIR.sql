@@ -0,0 +1,37 @@
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+ALTER TABLE portfolio_hourly_state VALIDATE CONSTRAINT fk_portfolio_hourly_state_run_context_account_hour;
+ALTER TABLE position_hourly_state VALIDATE CONSTRAINT fk_position_hourly_state_run_context_account_hour;
+ALTER TABLE risk_hourly_state VALIDATE CONSTRAINT fk_risk_hourly_state_run_context_account_hour;
+
+ALTER TABLE portfolio_hourly_state
+    DROP CONSTRAINT IF EXISTS fk_portfolio_hourly_state_run_context;
+ALTER TABLE position_hourly_state
+    DROP CONSTRAINT IF EXISTS fk_position_hourly_state_run_context;
+ALTER TABLE risk_hourly_state
+    DROP CONSTRAINT IF EXISTS fk_risk_hourly_state_run_context;
+
+COMMIT;
+
+SELECT
+    'hourly_state_account_hour_fk_not_validated' AS check_name,
+    COUNT(*) AS violations
+FROM pg_constraint
+WHERE conname IN (
+    'fk_portfolio_hourly_state_run_context_account_hour',
+    'fk_position_hourly_state_run_context_account_hour',
+    'fk_risk_hourly_state_run_context_account_hour'
+)
+  AND NOT convalidated
+UNION ALL
+SELECT
+    'hourly_state_redundant_run_context_fk_present' AS check_name,
+    COUNT(*) AS violations
+FROM pg_constraint
+WHERE conname IN (
+    'fk_portfolio_hourly_state_run_context',
+    'fk_position_hourly_state_run_context',
+    'fk_risk_hourly_state_run_context'
+);
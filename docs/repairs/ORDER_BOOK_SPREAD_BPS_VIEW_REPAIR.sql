@@ -0,0 +1,37 @@
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+ALTER TABLE order_book_snapshot
+    DROP COLUMN IF EXISTS spread_bps;
+
+CREATE OR REPLACE VIEW v_order_book_snapshot AS
+ SELECT order_book_snapshot.asset_id,
+    order_book_snapshot.snapshot_ts_utc,
+    order_book_snapshot.hour_ts_utc,
+    order_book_snapshot.best_bid_price,
+    order_book_snapshot.best_ask_price,
+    order_book_snapshot.best_bid_size,
+    order_book_snapshot.best_ask_size,
+    order_book_snapshot.spread_abs,
+    (((order_book_snapshot.spread_abs / NULLIF(order_book_snapshot.best_bid_price, (0)::numeric)) * (10000)::numeric))::numeric(12,8) AS spread_bps,
+    order_book_snapshot.source_venue,
+    order_book_snapshot.ingest_run_id,
+    order_book_snapshot.row_hash
+   FROM order_book_snapshot;
+
+COMMIT;
+
+SELECT
+    'order_book_snapshot_stored_spread_bps_present' AS check_name,
+    COUNT(*) AS violations
+FROM information_schema.columns
+WHERE table_name = 'order_book_snapshot'
+  AND column_name = 'spread_bps'
+UNION ALL
+SELECT
+    'v_order_book_snapshot_spread_bps_missing' AS check_name,
+    1 - COUNT(*) AS violations
+FROM information_schema.columns
+WHERE table_name = 'v_order_book_snapshot'
+  AND column_name = 'spread_bps';
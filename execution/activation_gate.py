@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivationRecord:
     """Projection of model_activation_gate for deterministic checks."""
 
@@ -19,7 +19,7 @@ class ActivationRecord:
     approval_hash: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivationGateResult:
     """Activation gate evaluation result."""
 
@@ -28,6 +28,50 @@ class ActivationGateResult:
     detail: str
 
 
+# Results are immutable and depend only on the failing rule, so each outcome is
+# built once and shared by every call.
+_BACKTEST_ACTIVATION_PRESENT = ActivationGateResult(
+    allowed=False,
+    reason_code="BACKTEST_ACTIVATION_PRESENT",
+    detail="BACKTEST rows must not bind to model_activation_gate.",
+)
+_BACKTEST_OK = ActivationGateResult(
+    allowed=True,
+    reason_code="OK",
+    detail="Backtest mode validated without activation dependency.",
+)
+_MISSING_ACTIVATION = ActivationGateResult(
+    allowed=False,
+    reason_code="MISSING_ACTIVATION",
+    detail="Live/Paper prediction missing activation binding.",
+)
+_ACTIVATION_MODEL_MISMATCH = ActivationGateResult(
+    allowed=False,
+    reason_code="ACTIVATION_MODEL_MISMATCH",
+    detail="Activation model_version_id mismatch.",
+)
+_ACTIVATION_MODE_MISMATCH = ActivationGateResult(
+    allowed=False,
+    reason_code="ACTIVATION_MODE_MISMATCH",
+    detail="Activation run_mode mismatch.",
+)
+_ACTIVATION_NOT_APPROVED = ActivationGateResult(
+    allowed=False,
+    reason_code="ACTIVATION_NOT_APPROVED",
+    detail="Activation record is not APPROVED.",
+)
+_ACTIVATION_WINDOW_NOT_REACHED = ActivationGateResult(
+    allowed=False,
+    reason_code="ACTIVATION_WINDOW_NOT_REACHED",
+    detail="Validation window ends after execution hour.",
+)
+_ACTIVATION_OK = ActivationGateResult(
+    allowed=True,
+    reason_code="OK",
+    detail="Activation gate passed.",
+)
+
+
 def enforce_activation_gate(
     run_mode: str,
     hour_ts_utc: datetime,
@@ -39,54 +83,22 @@ def enforce_activation_gate(
 
     if normalized_mode == "BACKTEST":
         if activation is not None:
-            return ActivationGateResult(
-                allowed=False,
-                reason_code="BACKTEST_ACTIVATION_PRESENT",
-                detail="BACKTEST rows must not bind to model_activation_gate.",
-            )
-        return ActivationGateResult(
-            allowed=True,
-            reason_code="OK",
-            detail="Backtest mode validated without activation dependency.",
-        )
+            return _BACKTEST_ACTIVATION_PRESENT
+        return _BACKTEST_OK
 
     if activation is None:
-        return ActivationGateResult(
-            allowed=False,
-            reason_code="MISSING_ACTIVATION",
-            detail="Live/Paper prediction missing activation binding.",
-        )
+        return _MISSING_ACTIVATION
 
     if activation.model_version_id != model_version_id:
-        return ActivationGateResult(
-            allowed=False,
-            reason_code="ACTIVATION_MODEL_MISMATCH",
-            detail="Activation model_version_id mismatch.",
-        )
+        return _ACTIVATION_MODEL_MISMATCH
 
     if activation.run_mode != normalized_mode:
-        return ActivationGateResult(
-            allowed=False,
-            reason_code="ACTIVATION_MODE_MISMATCH",
-            detail="Activation run_mode mismatch.",
-        )
+        return _ACTIVATION_MODE_MISMATCH
 
     if activation.status != "APPROVED":
-        return ActivationGateResult(
-            allowed=False,
-            reason_code="ACTIVATION_NOT_APPROVED",
-            detail="Activation record is not APPROVED.",
-        )
+        return _ACTIVATION_NOT_APPROVED
 
     if activation.validation_window_end_utc > hour_ts_utc:
-        return ActivationGateResult(
-            allowed=False,
-            reason_code="ACTIVATION_WINDOW_NOT_REACHED",
-            detail="Validation window ends after execution hour.",
-        )
-
-    return ActivationGateResult(
-        allowed=True,
-        reason_code="OK",
-        detail="Activation gate passed.",
-    )
+        return _ACTIVATION_WINDOW_NOT_REACHED
+
+    return _ACTIVATION_OK
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_EVEN
+from functools import lru_cache
 from hashlib import sha256
 import uuid
 from typing import Any, Iterable
@@ -12,18 +13,30 @@ from typing import Any, Iterable
 NUMERIC_18 = Decimal("0.000000000000000001")
 NUMERIC_10 = Decimal("0.0000000001")
 
+# Indexed by decision score % 3.
+_ACTION_TABLE = (("ENTER", "LONG"), ("HOLD", "FLAT"), ("EXIT", "FLAT"))
+_ZERO_FRACTION = Decimal("0").quantize(NUMERIC_10)
+
 
 def normalize_decimal(value: Decimal, scale: Decimal = NUMERIC_18) -> Decimal:
     """Quantize decimals to deterministic precision."""
     return value.quantize(scale, rounding=ROUND_HALF_EVEN)
 
 
-def normalize_timestamp(value: datetime) -> str:
-    """Normalize timestamps to UTC RFC3339 without subsecond truncation."""
+@lru_cache(maxsize=4096)
+def _normalize_aware_timestamp(value: datetime) -> str:
     utc_value = value.astimezone(timezone.utc)
     return utc_value.isoformat().replace("+00:00", "Z")
 
 
+def normalize_timestamp(value: datetime) -> str:
+    """Normalize timestamps to UTC RFC3339 without subsecond truncation."""
+    if value.utcoffset() is None:
+        # Naive values resolve through the process-local timezone, so they never enter the cache.
+        return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    return _normalize_aware_timestamp(value)
+
+
 def normalize_token(value: Any) -> str:
     """Serialize primitive values deterministically for hashing."""
     if value is None:
@@ -39,7 +52,7 @@ def normalize_token(value: Any) -> str:
 
 def stable_hash(tokens: Iterable[Any]) -> str:
     """Compute a stable SHA256 hash over canonical token serialization."""
-    preimage = "|".join(normalize_token(token) for token in tokens)
+    preimage = "|".join([normalize_token(token) for token in tokens])
     return sha256(preimage.encode("utf-8")).hexdigest()
 
 
@@ -49,7 +62,7 @@ def stable_uuid(namespace: str, tokens: Iterable[Any]) -> uuid.UUID:
     return uuid.uuid5(uuid.NAMESPACE_URL, name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DecisionResult:
     """Pure deterministic decision payload."""
 
@@ -68,7 +81,9 @@ def deterministic_decision(
     cluster_state_hash: str,
 ) -> DecisionResult:
     """Pure deterministic decision function with no external side effects."""
-    decision_hash = stable_hash(
+    # All inputs are hex hashes, so normalize_token is the identity and the
+    # preimage matches stable_hash(("phase_1d_decision_v1", ...)) exactly.
+    preimage = "|".join(
         (
             "phase_1d_decision_v1",
             prediction_hash,
@@ -78,28 +93,22 @@ def deterministic_decision(
             cluster_state_hash,
         )
     )
-    score = int(decision_hash[:16], 16)
-    action_idx = score % 3
-    if action_idx == 0:
-        action = "ENTER"
-        direction = "LONG"
-    elif action_idx == 1:
-        action = "HOLD"
-        direction = "FLAT"
-    else:
-        action = "EXIT"
-        direction = "FLAT"
+    digest = sha256(preimage.encode("utf-8")).digest()
+    decision_hash = digest.hex()
+    score = int.from_bytes(digest[:8], "big")
+    action, direction = _ACTION_TABLE[score % 3]
 
-    confidence = normalize_decimal(
-        Decimal(score % 10_000) / Decimal(10_000),
-        scale=NUMERIC_10,
-    )
+    # Both values are exact at NUMERIC_10 scale, so build them from scaled integers
+    # rather than dividing and quantizing: (score % 10_000) / 10_000 and
+    # ((score // 10_000) % 2_000) / 100_000, each expressed in units of 1e-10.
+    confidence = Decimal((score % 10_000) * 1_000_000).scaleb(-10)
 
     # Runtime risk constraints cap base position size at 2%; keep this deterministic.
-    raw_fraction = Decimal((score // 10_000) % 2_000) / Decimal(100_000)
-    position_size_fraction = normalize_decimal(raw_fraction, scale=NUMERIC_10)
-    if action != "ENTER":
-        position_size_fraction = Decimal("0").quantize(NUMERIC_10)
+    # Only ENTER sizes a position, so HOLD/EXIT share the hoisted zero.
+    if action == "ENTER":
+        position_size_fraction = Decimal(((score // 10_000) % 2_000) * 100_000).scaleb(-10)
+    else:
+        position_size_fraction = _ZERO_FRACTION
 
     return DecisionResult(
         decision_hash=decision_hash,
@@ -20,6 +20,7 @@ from execution.phase6.common import Phase6Clock, Phase6Database, ensure_dir
 from execution.phase6.drift_monitor import DriftObservation, DriftThresholds, persist_drift_event
 from execution.phase6.gap_repair import repair_pending_gaps
 from execution.phase6.incremental_sync import run_incremental_sync
+from execution.phase6.ohlcv_archive import export_ohlcv_month_to_parquet, ohlcv_month_export_hash
 from execution.phase6.phase6_config import Phase6Config
 from execution.phase6.provider_contract import HistoricalProvider
 from execution.phase6.training_pipeline import run_training_cycle
@@ -341,6 +342,77 @@ class Phase6AutonomyDaemon:
             f"repaired={result.repaired_count},failed={result.failed_count}",
         )
 
+    def run_ohlcv_archive(self, *, month_start_utc: datetime) -> None:
+        """Export one closed UTC month of OHLCV bars to the parquet cold tier."""
+        self._assert_min_free_disk(stage="OHLCV_ARCHIVE_START")
+        month = month_start_utc.astimezone(timezone.utc).strftime("%Y-%m")
+        self._log_event("OHLCV_ARCHIVE", "STARTED", f"month={month}")
+        try:
+            export = export_ohlcv_month_to_parquet(
+                self._db,
+                base_dir=self._config.local_data_cache_dir,
+                month_start_utc=month_start_utc,
+            )
+        except Exception as exc:
+            self._log_event("OHLCV_ARCHIVE", "FAILED", f"month={month},error={type(exc).__name__}:{exc}")
+            raise
+        if export is None:
+            self._log_event("OHLCV_ARCHIVE", "SKIPPED", f"month={month},rows=0")
+            return
+        self._log_event(
+            "OHLCV_ARCHIVE",
+            "COMPLETED",
+            f"month={month},rows={export.row_count},export_hash={export.export_hash},file_sha256={export.file_sha256}",
+        )
+
+    def _last_ohlcv_archive_export_hash(self, month: str) -> str | None:
+        row = self._db.fetch_one(
+            """
+            SELECT details
+            FROM automation_event_log
+            WHERE event_type = 'OHLCV_ARCHIVE'
+              AND status = 'COMPLETED'
+              AND details LIKE :month_prefix
+            ORDER BY event_ts_utc DESC, event_id DESC
+            LIMIT 1
+            """,
+            {"month_prefix": f"month={month},%"},
+        )
+        if row is None:
+            return None
+        fields = dict(part.split("=", 1) for part in str(row["details"]).split(","))
+        return fields.get("export_hash")
+
+    def _ohlcv_month_has_pending_gaps(self, month_start_utc: datetime, month_end_utc: datetime) -> bool:
+        row = self._db.fetch_one(
+            """
+            SELECT COUNT(*) AS n
+            FROM data_gap_event
+            WHERE status = 'PENDING'
+              AND gap_start_ts_utc < :month_end_utc
+              AND gap_end_ts_utc > :month_start_utc
+            """,
+            {"month_start_utc": month_start_utc, "month_end_utc": month_end_utc},
+        )
+        return int(row["n"]) > 0 if row is not None else False
+
+    def maybe_run_ohlcv_archive(self) -> bool:
+        """Archive the previous UTC month once it has settled and its rows differ from the last export."""
+        now_utc = self._clock.now_utc().astimezone(timezone.utc)
+        current_month_start = now_utc.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        if now_utc < current_month_start + timedelta(hours=self._config.ohlcv_archive_grace_hours):
+            return False
+        previous_month_start = (current_month_start - timedelta(days=1)).replace(day=1)
+        if self._ohlcv_month_has_pending_gaps(previous_month_start, current_month_start):
+            return False
+        current_hash = ohlcv_month_export_hash(self._db, month_start_utc=previous_month_start)
+        if current_hash is None:
+            return False
+        if current_hash == self._last_ohlcv_archive_export_hash(previous_month_start.strftime("%Y-%m")):
+            return False
+        self.run_ohlcv_archive(month_start_utc=previous_month_start)
+        return True
+
     def run_training(self, *, cycle_kind: str = "SCHEDULED") -> None:
         """Run one training cycle with strict local-data gate."""
         if self._config.force_local_data_for_training and self._config.allow_provider_calls_during_training:
@@ -428,39 +500,34 @@ class Phase6AutonomyDaemon:
         return int(row["n"]) > 0 if row is not None else False
 
     def _compute_feature_psi(self) -> Decimal:
-        snapshot_rows = self._db.fetch_all(
-            """
-            SELECT dataset_snapshot_id
-            FROM dataset_snapshot
-            ORDER BY generated_at_utc DESC
-            LIMIT 2
-            """,
-            {},
-        )
-        if len(snapshot_rows) < 2:
-            return Decimal("0")
-
-        latest_id = str(snapshot_rows[0]["dataset_snapshot_id"])
-        prior_id = str(snapshot_rows[1]["dataset_snapshot_id"])
         component_rows = self._db.fetch_all(
             """
-            SELECT dataset_snapshot_id, symbol, component_row_count
-            FROM dataset_snapshot_component
-            WHERE dataset_snapshot_id = ANY(:dataset_snapshot_ids)
+            WITH recent_snapshot AS (
+                SELECT dataset_snapshot_id, generated_at_utc
+                FROM dataset_snapshot
+                ORDER BY generated_at_utc DESC
+                LIMIT 2
+            )
+            SELECT rs.dataset_snapshot_id, dsc.symbol, dsc.component_row_count
+            FROM recent_snapshot rs
+            LEFT JOIN dataset_snapshot_component dsc
+              ON dsc.dataset_snapshot_id = rs.dataset_snapshot_id
+            ORDER BY rs.generated_at_utc DESC, rs.dataset_snapshot_id ASC
             """,
-            {"dataset_snapshot_ids": [latest_id, prior_id]},
+            {},
         )
 
-        latest_counts: dict[str, int] = {}
-        prior_counts: dict[str, int] = {}
+        counts_by_snapshot: dict[str, dict[str, int]] = {}
         for row in component_rows:
-            snapshot_id = str(row["dataset_snapshot_id"])
+            snapshot_counts = counts_by_snapshot.setdefault(str(row["dataset_snapshot_id"]), {})
+            if row["symbol"] is None:
+                continue
             symbol = str(row["symbol"]).upper()
-            count = int(row["component_row_count"])
-            if snapshot_id == latest_id:
-                latest_counts[symbol] = latest_counts.get(symbol, 0) + count
-            elif snapshot_id == prior_id:
-                prior_counts[symbol] = prior_counts.get(symbol, 0) + count
+            snapshot_counts[symbol] = snapshot_counts.get(symbol, 0) + int(row["component_row_count"])
+        if len(counts_by_snapshot) < 2:
+            return Decimal("0")
+
+        latest_counts, prior_counts = list(counts_by_snapshot.values())[:2]
 
         latest_total = sum(latest_counts.values())
         prior_total = sum(prior_counts.values())
@@ -658,6 +725,7 @@ class Phase6AutonomyDaemon:
         else:
             self._log_event("INGESTION", "SKIPPED", "enable_continuous_ingestion=false")
         self.run_gap_repair()
+        self.maybe_run_ohlcv_archive()
 
         if not self._config.enable_autonomous_retraining:
             self._log_event("TRAINING_GATE", "SKIPPED", "enable_autonomous_retraining=false")
@@ -69,55 +69,57 @@ def _persist_ohlcv_rows(
     asset_id: int,
     bars: Sequence[OhlcvBar],
 ) -> int:
-    written = 0
-    for bar in bars:
-        row_hash = stable_hash(
-            (
-                "market_ohlcv_hourly",
-                asset_id,
-                bar.hour_ts_utc.isoformat(),
-                bar.source_venue,
-                str(bar.open_price),
-                str(bar.high_price),
-                str(bar.low_price),
-                str(bar.close_price),
-                str(bar.volume_base),
-                str(bar.volume_quote),
-                bar.trade_count,
-            )
-        )
-        db.execute(
-            """
-            INSERT INTO market_ohlcv_hourly (
-                asset_id, hour_ts_utc,
-                open_price, high_price, low_price, close_price,
-                volume_base, volume_quote, trade_count,
-                source_venue, ingest_run_id, row_hash
-            ) VALUES (
-                :asset_id, :hour_ts_utc,
-                :open_price, :high_price, :low_price, :close_price,
-                :volume_base, :volume_quote, :trade_count,
-                :source_venue, :ingest_run_id, :row_hash
-            )
-            ON CONFLICT (asset_id, hour_ts_utc, source_venue) DO NOTHING
-            """,
-            {
-                "asset_id": asset_id,
-                "hour_ts_utc": bar.hour_ts_utc,
-                "open_price": bar.open_price,
-                "high_price": bar.high_price,
-                "low_price": bar.low_price,
-                "close_price": bar.close_price,
-                "volume_base": bar.volume_base,
-                "volume_quote": bar.volume_quote,
-                "trade_count": bar.trade_count,
-                "source_venue": bar.source_venue,
-                "ingest_run_id": ingest_run_id,
-                "row_hash": row_hash,
-            },
+    rows = [
+        {
+            "asset_id": asset_id,
+            "hour_ts_utc": bar.hour_ts_utc,
+            "open_price": bar.open_price,
+            "high_price": bar.high_price,
+            "low_price": bar.low_price,
+            "close_price": bar.close_price,
+            "volume_base": bar.volume_base,
+            "volume_quote": bar.volume_quote,
+            "trade_count": bar.trade_count,
+            "source_venue": bar.source_venue,
+            "ingest_run_id": ingest_run_id,
+            "row_hash": stable_hash(
+                (
+                    "market_ohlcv_hourly",
+                    asset_id,
+                    bar.hour_ts_utc.isoformat(),
+                    bar.source_venue,
+                    str(bar.open_price),
+                    str(bar.high_price),
+                    str(bar.low_price),
+                    str(bar.close_price),
+                    str(bar.volume_base),
+                    str(bar.volume_quote),
+                    bar.trade_count,
+                )
+            ),
+        }
+        for bar in bars
+    ]
+    if not rows:
+        return 0
+    db.execute_many(
+        """
+        INSERT INTO market_ohlcv_hourly (
+            asset_id, hour_ts_utc,
+            open_price, high_price, low_price, close_price,
+            volume_base, volume_quote, trade_count,
+            source_venue, ingest_run_id, row_hash
+        ) VALUES (
+            :asset_id, :hour_ts_utc,
+            :open_price, :high_price, :low_price, :close_price,
+            :volume_base, :volume_quote, :trade_count,
+            :source_venue, :ingest_run_id, :row_hash
         )
-        written += 1
-    return written
+        ON CONFLICT (asset_id, hour_ts_utc, source_venue) DO NOTHING
+        """,
+        rows,
+    )
+    return len(rows)
 
 
 def run_bootstrap_backfill(
@@ -150,6 +152,7 @@ def run_bootstrap_backfill(
     bars_written = 0
     trades_archived = 0
     completed_symbols = 0
+    watermark_rows: list[dict[str, object]] = []
 
     for symbol in universe_symbols:
         asset_id = asset_id_by_symbol[symbol]
@@ -183,8 +186,22 @@ def run_bootstrap_backfill(
 
         trades_archived += symbol_trade_count
 
-        watermark_hash = stable_hash(("bootstrap_watermark", symbol, end_ts_utc.isoformat(), symbol_trade_count))
-        db.execute(
+        watermark_rows.append(
+            {
+                "ingestion_cycle_id": cycle_id,
+                "source_name": "COINAPI",
+                "symbol": symbol,
+                "watermark_kind": "BOOTSTRAP_END",
+                "watermark_ts_utc": end_ts_utc,
+                "watermark_cursor": cursor,
+                "records_ingested": symbol_trade_count,
+                "row_hash": stable_hash(("bootstrap_watermark", symbol, end_ts_utc.isoformat(), symbol_trade_count)),
+            }
+        )
+        completed_symbols += 1
+
+    if watermark_rows:
+        db.execute_many(
             """
             INSERT INTO ingestion_watermark_history (
                 ingestion_cycle_id, source_name, symbol,
@@ -196,18 +213,8 @@ def run_bootstrap_backfill(
                 :records_ingested, :row_hash
             )
             """,
-            {
-                "ingestion_cycle_id": cycle_id,
-                "source_name": "COINAPI",
-                "symbol": symbol,
-                "watermark_kind": "BOOTSTRAP_END",
-                "watermark_ts_utc": end_ts_utc,
-                "watermark_cursor": cursor,
-                "records_ingested": symbol_trade_count,
-                "row_hash": watermark_hash,
-            },
+            watermark_rows,
         )
-        completed_symbols += 1
 
     _persist_cycle(
         db,
@@ -24,6 +24,9 @@ class Phase6Database(Protocol):
     def execute(self, sql: str, params: Mapping[str, Any]) -> None:
         """Execute mutation statement."""
 
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        """Execute one mutation statement for a batch of parameter rows."""
+
 
 @dataclass(frozen=True)
 class Phase6Clock:
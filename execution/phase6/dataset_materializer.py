@@ -112,18 +112,18 @@ def materialize_tick_canonical_dataset(
         },
     )
 
-    for symbol, file_path, row_count in components:
-        db.execute(
-            """
-            INSERT INTO dataset_snapshot_component (
-                dataset_snapshot_id, symbol, component_path,
-                component_row_count, component_hash, row_hash
-            ) VALUES (
-                :dataset_snapshot_id, :symbol, :component_path,
-                :component_row_count, :component_hash, :row_hash
-            )
-            ON CONFLICT (dataset_snapshot_id, symbol, component_path) DO NOTHING
-            """,
+    db.execute_many(
+        """
+        INSERT INTO dataset_snapshot_component (
+            dataset_snapshot_id, symbol, component_path,
+            component_row_count, component_hash, row_hash
+        ) VALUES (
+            :dataset_snapshot_id, :symbol, :component_path,
+            :component_row_count, :component_hash, :row_hash
+        )
+        ON CONFLICT (dataset_snapshot_id, symbol, component_path) DO NOTHING
+        """,
+        [
             {
                 "dataset_snapshot_id": snapshot_id,
                 "symbol": symbol,
@@ -131,8 +131,10 @@ def materialize_tick_canonical_dataset(
                 "component_row_count": row_count,
                 "component_hash": stable_hash(("dataset_component", snapshot_id, symbol, file_path, row_count)),
                 "row_hash": stable_hash(("dataset_component_row", snapshot_id, symbol, file_path)),
-            },
-        )
+            }
+            for symbol, file_path, row_count in components
+        ],
+    )
 
     return DatasetSnapshotResult(
         dataset_snapshot_id=snapshot_id,
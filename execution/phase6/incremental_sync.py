@@ -113,6 +113,7 @@ def run_incremental_sync(
     trades_archived = 0
     ohlcv_api_calls = 0
     trade_api_calls = 0
+    watermark_rows: list[dict[str, object]] = []
 
     for symbol in symbols:
         last_ts, cursor = _latest_trade_watermark(db, symbol)
@@ -130,9 +131,27 @@ def run_incremental_sync(
         if _should_refresh_hourly_bars(last_ts, end_ts):
             bars = provider.fetch_ohlcv(symbol, start_ts, end_ts, "1HRS")
             ohlcv_api_calls += 1
-        for bar in bars:
-            row_hash = stable_hash(("market_ohlcv_hourly", symbol, bar.hour_ts_utc.isoformat(), str(bar.close_price)))
-            db.execute(
+        rows = [
+            {
+                "asset_id": asset_id_by_symbol[symbol],
+                "hour_ts_utc": bar.hour_ts_utc,
+                "open_price": bar.open_price,
+                "high_price": bar.high_price,
+                "low_price": bar.low_price,
+                "close_price": bar.close_price,
+                "volume_base": bar.volume_base,
+                "volume_quote": bar.volume_quote,
+                "trade_count": bar.trade_count,
+                "source_venue": bar.source_venue,
+                "ingest_run_id": cycle_id,
+                "row_hash": stable_hash(
+                    ("market_ohlcv_hourly", symbol, bar.hour_ts_utc.isoformat(), str(bar.close_price))
+                ),
+            }
+            for bar in bars
+        ]
+        if rows:
+            db.execute_many(
                 """
                 INSERT INTO market_ohlcv_hourly (
                     asset_id, hour_ts_utc,
@@ -147,22 +166,9 @@ def run_incremental_sync(
                 )
                 ON CONFLICT (asset_id, hour_ts_utc, source_venue) DO NOTHING
                 """,
-                {
-                    "asset_id": asset_id_by_symbol[symbol],
-                    "hour_ts_utc": bar.hour_ts_utc,
-                    "open_price": bar.open_price,
-                    "high_price": bar.high_price,
-                    "low_price": bar.low_price,
-                    "close_price": bar.close_price,
-                    "volume_base": bar.volume_base,
-                    "volume_quote": bar.volume_quote,
-                    "trade_count": bar.trade_count,
-                    "source_venue": bar.source_venue,
-                    "ingest_run_id": cycle_id,
-                    "row_hash": row_hash,
-                },
+                rows,
             )
-            bars_written += 1
+            bars_written += len(rows)
 
         trades, next_cursor = provider.fetch_trades(symbol, start_ts, end_ts, cursor)
         trade_api_calls += 1
@@ -182,7 +188,19 @@ def run_incremental_sync(
         trades_archived += len(trades)
         symbols_synced += 1
 
-        db.execute(
+        watermark_rows.append(
+            {
+                "ingestion_cycle_id": cycle_id,
+                "symbol": symbol,
+                "watermark_ts_utc": end_ts,
+                "watermark_cursor": next_cursor,
+                "records_ingested": len(trades),
+                "row_hash": stable_hash(("watermark", cycle_id, symbol, end_ts.isoformat(), len(trades))),
+            }
+        )
+
+    if watermark_rows:
+        db.execute_many(
             """
             INSERT INTO ingestion_watermark_history (
                 ingestion_cycle_id, source_name, symbol,
@@ -194,14 +212,7 @@ def run_incremental_sync(
                 :records_ingested, :row_hash
             )
             """,
-            {
-                "ingestion_cycle_id": cycle_id,
-                "symbol": symbol,
-                "watermark_ts_utc": end_ts,
-                "watermark_cursor": next_cursor,
-                "records_ingested": len(trades),
-                "row_hash": stable_hash(("watermark", cycle_id, symbol, end_ts.isoformat(), len(trades))),
-            },
+            watermark_rows,
         )
 
     return IncrementalSyncResult(
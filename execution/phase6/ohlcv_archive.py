@@ -0,0 +1,176 @@
+"""Columnar cold-tier export of hourly OHLCV history for Phase 6 analytics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from hashlib import sha256
+import os
+from pathlib import Path
+
+from execution.decision_engine import stable_hash
+from execution.phase6.common import Phase6Database, ensure_dir, utc_iso
+
+
+@dataclass(frozen=True)
+class OhlcvParquetExport:
+    """Cold-tier parquet file metadata for one UTC month of OHLCV bars."""
+
+    month_utc: str
+    file_path: Path
+    row_count: int
+    min_hour_ts_utc: datetime
+    max_hour_ts_utc: datetime
+    file_sha256: str
+    export_hash: str
+
+
+def _next_month_start(month_start_utc: datetime) -> datetime:
+    if month_start_utc.month == 12:
+        return month_start_utc.replace(year=month_start_utc.year + 1, month=1)
+    return month_start_utc.replace(month=month_start_utc.month + 1)
+
+
+def _month_bounds(month_start_utc: datetime) -> tuple[datetime, datetime]:
+    month_start = month_start_utc.astimezone(timezone.utc)
+    if month_start != month_start.replace(day=1, hour=0, minute=0, second=0, microsecond=0):
+        raise RuntimeError("month_start_utc must be the first instant of a UTC month")
+    return month_start, _next_month_start(month_start)
+
+
+def _month_export_hash(month: str, row_count: int, min_hour: datetime, max_hour: datetime, rows_digest: str) -> str:
+    return stable_hash(
+        (
+            "market_ohlcv_hourly_parquet",
+            month,
+            row_count,
+            utc_iso(min_hour),
+            utc_iso(max_hour),
+            rows_digest,
+        )
+    )
+
+
+def ohlcv_month_export_hash(db: Phase6Database, *, month_start_utc: datetime) -> str | None:
+    """Return the export hash the month's current rows would produce, or None when the month is empty.
+
+    The digest is aggregated in PostgreSQL so callers can detect late-arriving
+    or repaired bars without pulling the month's rows.
+    """
+    month_start, month_end = _month_bounds(month_start_utc)
+    row = db.fetch_one(
+        """
+        SELECT
+            COUNT(*) AS row_count,
+            MIN(hour_ts_utc) AS min_hour_ts_utc,
+            MAX(hour_ts_utc) AS max_hour_ts_utc,
+            encode(
+                sha256(
+                    convert_to(
+                        string_agg(row_hash::text, '|' ORDER BY asset_id ASC, hour_ts_utc ASC, source_venue ASC),
+                        'UTF8'
+                    )
+                ),
+                'hex'
+            ) AS rows_digest
+        FROM market_ohlcv_hourly
+        WHERE hour_ts_utc >= :month_start_utc
+          AND hour_ts_utc < :month_end_utc
+        """,
+        {"month_start_utc": month_start, "month_end_utc": month_end},
+    )
+    if row is None or int(row["row_count"]) == 0:
+        return None
+    return _month_export_hash(
+        month_start.strftime("%Y-%m"),
+        int(row["row_count"]),
+        row["min_hour_ts_utc"].astimezone(timezone.utc),
+        row["max_hour_ts_utc"].astimezone(timezone.utc),
+        str(row["rows_digest"]),
+    )
+
+
+def export_ohlcv_month_to_parquet(
+    db: Phase6Database,
+    *,
+    base_dir: Path,
+    month_start_utc: datetime,
+) -> OhlcvParquetExport | None:
+    """Write one month of market_ohlcv_hourly to a ZSTD parquet file sorted by (asset_id, hour_ts_utc).
+
+    Rows stay in PostgreSQL; the parquet copy serves analytical scans (training
+    windows, backtests) with row-group statistics on asset_id and hour_ts_utc.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("pyarrow is required for OHLCV parquet export") from exc
+
+    month_start, month_end = _month_bounds(month_start_utc)
+
+    rows = db.fetch_all(
+        """
+        SELECT
+            asset_id, hour_ts_utc,
+            open_price, high_price, low_price, close_price,
+            volume_base, volume_quote, trade_count,
+            source_venue, row_hash
+        FROM market_ohlcv_hourly
+        WHERE hour_ts_utc >= :month_start_utc
+          AND hour_ts_utc < :month_end_utc
+        ORDER BY asset_id ASC, hour_ts_utc ASC, source_venue ASC
+        """,
+        {"month_start_utc": month_start, "month_end_utc": month_end},
+    )
+    if not rows:
+        return None
+
+    price = pa.decimal128(38, 18)
+    schema = pa.schema(
+        [
+            ("asset_id", pa.int16()),
+            ("hour_ts_utc", pa.timestamp("us", tz="UTC")),
+            ("open_price", price),
+            ("high_price", price),
+            ("low_price", price),
+            ("close_price", price),
+            ("volume_base", price),
+            ("volume_quote", price),
+            ("trade_count", pa.int64()),
+            ("source_venue", pa.string()),
+            ("row_hash", pa.string()),
+        ]
+    )
+    table = pa.Table.from_pylist([dict(row) for row in rows], schema=schema)
+
+    month = month_start.strftime("%Y-%m")
+    hours = [row["hour_ts_utc"] for row in rows]
+    min_hour = min(hours).astimezone(timezone.utc)
+    max_hour = max(hours).astimezone(timezone.utc)
+    export_hash = _month_export_hash(
+        month,
+        len(rows),
+        min_hour,
+        max_hour,
+        stable_hash(tuple(str(row["row_hash"]) for row in rows)),
+    )
+
+    # One file per month, swapped in atomically, so a re-export replaces the
+    # previous copy instead of leaving duplicate bars beside it.
+    out_dir = base_dir / "market_ohlcv_hourly" / f"month={month}"
+    ensure_dir(out_dir)
+    file_path = out_dir / "part.parquet"
+    temp_path = out_dir / "part.parquet.tmp"
+    pq.write_table(table, temp_path, compression="zstd")
+    os.replace(temp_path, file_path)
+
+    return OhlcvParquetExport(
+        month_utc=month,
+        file_path=file_path,
+        row_count=len(rows),
+        min_hour_ts_utc=min_hour,
+        max_hour_ts_utc=max_hour,
+        file_sha256=sha256(file_path.read_bytes()).hexdigest(),
+        export_hash=export_hash,
+    )
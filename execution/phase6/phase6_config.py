@@ -41,6 +41,7 @@ class Phase6Config:
     daemon_lock_stale_seconds: int
     daemon_failure_backoff_seconds: int
     daemon_max_consecutive_failures: int
+    ohlcv_archive_grace_hours: int
 
 
 _REQUIRED_KEYS: tuple[str, ...] = (
@@ -140,4 +141,5 @@ def load_phase6_config() -> Phase6Config:
         daemon_lock_stale_seconds=_read_int("PHASE6_DAEMON_LOCK_STALE_SECONDS", 900),
         daemon_failure_backoff_seconds=_read_int("PHASE6_DAEMON_FAILURE_BACKOFF_SECONDS", 120),
         daemon_max_consecutive_failures=_read_int("PHASE6_DAEMON_MAX_CONSECUTIVE_FAILURES", 10),
+        ohlcv_archive_grace_hours=_read_int("PHASE6_OHLCV_ARCHIVE_GRACE_HOURS", 24),
     )
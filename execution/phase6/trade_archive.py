@@ -126,44 +126,48 @@ def persist_trade_chunk_manifest(
     chunks: Iterable[RawTradeChunk],
 ) -> None:
     """Persist local archive chunk metadata lineage."""
-    for chunk in chunks:
-        row_hash = stable_hash(
-            (
-                "raw_trade_chunk_manifest",
-                ingestion_cycle_id,
-                source,
-                symbol,
-                chunk.day_utc,
-                chunk.file_sha256,
-                chunk.chunk_hash,
-            )
-        )
-        db.execute(
-            """
-            INSERT INTO raw_trade_chunk_manifest (
-                ingestion_cycle_id, source_name, symbol, day_utc,
-                file_path, file_sha256, row_count,
-                min_trade_ts_utc, max_trade_ts_utc,
-                chunk_hash, row_hash
-            ) VALUES (
-                :ingestion_cycle_id, :source_name, :symbol, :day_utc,
-                :file_path, :file_sha256, :row_count,
-                :min_trade_ts_utc, :max_trade_ts_utc,
-                :chunk_hash, :row_hash
-            )
-            ON CONFLICT (source_name, symbol, day_utc, file_sha256) DO NOTHING
-            """,
-            {
-                "ingestion_cycle_id": ingestion_cycle_id,
-                "source_name": source,
-                "symbol": symbol,
-                "day_utc": chunk.day_utc,
-                "file_path": str(chunk.file_path),
-                "file_sha256": chunk.file_sha256,
-                "row_count": chunk.row_count,
-                "min_trade_ts_utc": chunk.min_trade_ts_utc,
-                "max_trade_ts_utc": chunk.max_trade_ts_utc,
-                "chunk_hash": chunk.chunk_hash,
-                "row_hash": row_hash,
-            },
+    rows = [
+        {
+            "ingestion_cycle_id": ingestion_cycle_id,
+            "source_name": source,
+            "symbol": symbol,
+            "day_utc": chunk.day_utc,
+            "file_path": str(chunk.file_path),
+            "file_sha256": chunk.file_sha256,
+            "row_count": chunk.row_count,
+            "min_trade_ts_utc": chunk.min_trade_ts_utc,
+            "max_trade_ts_utc": chunk.max_trade_ts_utc,
+            "chunk_hash": chunk.chunk_hash,
+            "row_hash": stable_hash(
+                (
+                    "raw_trade_chunk_manifest",
+                    ingestion_cycle_id,
+                    source,
+                    symbol,
+                    chunk.day_utc,
+                    chunk.file_sha256,
+                    chunk.chunk_hash,
+                )
+            ),
+        }
+        for chunk in chunks
+    ]
+    if not rows:
+        return
+    db.execute_many(
+        """
+        INSERT INTO raw_trade_chunk_manifest (
+            ingestion_cycle_id, source_name, symbol, day_utc,
+            file_path, file_sha256, row_count,
+            min_trade_ts_utc, max_trade_ts_utc,
+            chunk_hash, row_hash
+        ) VALUES (
+            :ingestion_cycle_id, :source_name, :symbol, :day_utc,
+            :file_path, :file_sha256, :row_count,
+            :min_trade_ts_utc, :max_trade_ts_utc,
+            :chunk_hash, :row_hash
         )
+        ON CONFLICT (source_name, symbol, day_utc, file_sha256) DO NOTHING
+        """,
+        rows,
+    )
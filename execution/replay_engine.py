@@ -68,6 +68,9 @@ class RuntimeDatabase(Protocol):
     def execute(self, sql: str, params: Mapping[str, Any]) -> None:
         """Execute SQL mutation."""
 
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        """Execute one SQL mutation for each parameter mapping."""
+
 
 @dataclass(frozen=True)
 class ReplayMismatch:
@@ -159,8 +162,7 @@ def execute_hour(
             risk_profile=risk_profile,
         )
 
-        for signal in planned.trade_signals:
-            writer.insert_trade_signal(signal)
+        writer.insert_trade_signals(planned.trade_signals)
         for order in planned.order_requests:
             writer.insert_order_request(order)
         for fill in planned.order_fills:
@@ -169,8 +171,7 @@ def execute_hour(
             writer.insert_position_lot(lot)
         for trade in planned.executed_trades:
             writer.insert_executed_trade(trade)
-        for risk_event in planned.risk_events:
-            writer.insert_risk_event(risk_event)
+        writer.insert_risk_events(planned.risk_events)
 
         cash_rows = _ensure_phase5_cash_ledger_rows(
             db=db,
@@ -661,15 +662,17 @@ def _ensure_phase5_hourly_state(
                 f"cluster_exposure_hourly_state contains unexpected cluster_id={cluster_id} for hour."
             )
 
+    missing_cluster_rows: list[ClusterExposureHourlyStateRow] = []
     for cluster_id, expected_row in expected_clusters.items():
         stored_row = stored_cluster_map.get(cluster_id)
         if stored_row is None:
-            writer.insert_cluster_exposure_hourly_state(expected_row)
+            missing_cluster_rows.append(expected_row)
             continue
         if str(stored_row["row_hash"]) != expected_row.row_hash:
             raise DeterministicAbortError(
                 f"cluster_exposure_hourly_state hash mismatch for cluster_id={cluster_id}."
             )
+    writer.insert_cluster_exposure_hourly_states(missing_cluster_rows)
 
     return expected
 
@@ -37,6 +37,9 @@ class DeterministicWriterDatabase(Protocol):
     def execute(self, sql: str, params: Mapping[str, Any]) -> None:
         """Execute INSERT-only SQL statements."""
 
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        """Execute one INSERT-only SQL statement for each parameter mapping."""
+
 
 @dataclass(frozen=True)
 class TradeSignalRow:
@@ -431,8 +434,10 @@ class AppendOnlyRuntimeWriter:
             row_hash=row_hash,
         )
 
-    def insert_trade_signal(self, signal: TradeSignalRow) -> None:
-        self._db.execute(
+    def insert_trade_signals(self, signals: Sequence[TradeSignalRow]) -> None:
+        if not signals:
+            return
+        self._db.execute_many(
             """
             INSERT INTO trade_signal (
                 signal_id, run_id, run_mode, account_id, asset_id, hour_ts_utc, horizon,
@@ -448,30 +453,33 @@ class AppendOnlyRuntimeWriter:
                 :risk_state_run_id, :cluster_membership_id, :upstream_hash, :row_hash
             )
             """,
-            {
-                "signal_id": str(signal.signal_id),
-                "run_id": str(signal.run_id),
-                "run_mode": signal.run_mode,
-                "account_id": signal.account_id,
-                "asset_id": signal.asset_id,
-                "hour_ts_utc": signal.hour_ts_utc,
-                "horizon": signal.horizon,
-                "action": signal.action,
-                "direction": signal.direction,
-                "confidence": signal.confidence,
-                "expected_return": signal.expected_return,
-                "assumed_fee_rate": signal.assumed_fee_rate,
-                "assumed_slippage_rate": signal.assumed_slippage_rate,
-                "net_edge": signal.net_edge,
-                "target_position_notional": signal.target_position_notional,
-                "position_size_fraction": signal.position_size_fraction,
-                "risk_state_hour_ts_utc": signal.risk_state_hour_ts_utc,
-                "decision_hash": signal.decision_hash,
-                "risk_state_run_id": str(signal.risk_state_run_id),
-                "cluster_membership_id": signal.cluster_membership_id,
-                "upstream_hash": signal.upstream_hash,
-                "row_hash": signal.row_hash,
-            },
+            [
+                {
+                    "signal_id": str(signal.signal_id),
+                    "run_id": str(signal.run_id),
+                    "run_mode": signal.run_mode,
+                    "account_id": signal.account_id,
+                    "asset_id": signal.asset_id,
+                    "hour_ts_utc": signal.hour_ts_utc,
+                    "horizon": signal.horizon,
+                    "action": signal.action,
+                    "direction": signal.direction,
+                    "confidence": signal.confidence,
+                    "expected_return": signal.expected_return,
+                    "assumed_fee_rate": signal.assumed_fee_rate,
+                    "assumed_slippage_rate": signal.assumed_slippage_rate,
+                    "net_edge": signal.net_edge,
+                    "target_position_notional": signal.target_position_notional,
+                    "position_size_fraction": signal.position_size_fraction,
+                    "risk_state_hour_ts_utc": signal.risk_state_hour_ts_utc,
+                    "decision_hash": signal.decision_hash,
+                    "risk_state_run_id": str(signal.risk_state_run_id),
+                    "cluster_membership_id": signal.cluster_membership_id,
+                    "upstream_hash": signal.upstream_hash,
+                    "row_hash": signal.row_hash,
+                }
+                for signal in signals
+            ],
         )
 
     def build_order_request_row(
@@ -1051,8 +1059,10 @@ class AppendOnlyRuntimeWriter:
             row_hash=row_hash,
         )
 
-    def insert_risk_event(self, risk_event: RiskEventRow) -> None:
-        self._db.execute(
+    def insert_risk_events(self, risk_events: Sequence[RiskEventRow]) -> None:
+        if not risk_events:
+            return
+        self._db.execute_many(
             """
             INSERT INTO risk_event (
                 risk_event_id, run_id, run_mode, account_id, event_ts_utc, hour_ts_utc,
@@ -1064,22 +1074,25 @@ class AppendOnlyRuntimeWriter:
                 :origin_hour_ts_utc, :parent_state_hash, :row_hash
             )
             """,
-            {
-                "risk_event_id": str(risk_event.risk_event_id),
-                "run_id": str(risk_event.run_id),
-                "run_mode": risk_event.run_mode,
-                "account_id": risk_event.account_id,
-                "event_ts_utc": risk_event.event_ts_utc,
-                "hour_ts_utc": risk_event.hour_ts_utc,
-                "event_type": risk_event.event_type,
-                "severity": risk_event.severity,
-                "reason_code": risk_event.reason_code,
-                "details": risk_event.details,
-                "related_state_hour_ts_utc": risk_event.related_state_hour_ts_utc,
-                "origin_hour_ts_utc": risk_event.origin_hour_ts_utc,
-                "parent_state_hash": risk_event.parent_state_hash,
-                "row_hash": risk_event.row_hash,
-            },
+            [
+                {
+                    "risk_event_id": str(risk_event.risk_event_id),
+                    "run_id": str(risk_event.run_id),
+                    "run_mode": risk_event.run_mode,
+                    "account_id": risk_event.account_id,
+                    "event_ts_utc": risk_event.event_ts_utc,
+                    "hour_ts_utc": risk_event.hour_ts_utc,
+                    "event_type": risk_event.event_type,
+                    "severity": risk_event.severity,
+                    "reason_code": risk_event.reason_code,
+                    "details": risk_event.details,
+                    "related_state_hour_ts_utc": risk_event.related_state_hour_ts_utc,
+                    "origin_hour_ts_utc": risk_event.origin_hour_ts_utc,
+                    "parent_state_hash": risk_event.parent_state_hash,
+                    "row_hash": risk_event.row_hash,
+                }
+                for risk_event in risk_events
+            ],
         )
 
     def build_cash_economic_event_hash(
@@ -1815,8 +1828,10 @@ class AppendOnlyRuntimeWriter:
             row_hash=row_hash,
         )
 
-    def insert_cluster_exposure_hourly_state(self, row: ClusterExposureHourlyStateRow) -> None:
-        self._db.execute(
+    def insert_cluster_exposure_hourly_states(self, rows: Sequence[ClusterExposureHourlyStateRow]) -> None:
+        if not rows:
+            return
+        self._db.execute_many(
             """
             INSERT INTO cluster_exposure_hourly_state (
                 run_mode, account_id, cluster_id, hour_ts_utc, source_run_id,
@@ -1828,19 +1843,22 @@ class AppendOnlyRuntimeWriter:
                 :state_hash, :parent_risk_hash, :row_hash
             )
             """,
-            {
-                "run_mode": row.run_mode,
-                "account_id": row.account_id,
-                "cluster_id": row.cluster_id,
-                "hour_ts_utc": row.hour_ts_utc,
-                "source_run_id": str(row.source_run_id),
-                "gross_exposure_notional": row.gross_exposure_notional,
-                "exposure_pct": row.exposure_pct,
-                "max_cluster_exposure_pct": row.max_cluster_exposure_pct,
-                "state_hash": row.state_hash,
-                "parent_risk_hash": row.parent_risk_hash,
-                "row_hash": row.row_hash,
-            },
+            [
+                {
+                    "run_mode": row.run_mode,
+                    "account_id": row.account_id,
+                    "cluster_id": row.cluster_id,
+                    "hour_ts_utc": row.hour_ts_utc,
+                    "source_run_id": str(row.source_run_id),
+                    "gross_exposure_notional": row.gross_exposure_notional,
+                    "exposure_pct": row.exposure_pct,
+                    "max_cluster_exposure_pct": row.max_cluster_exposure_pct,
+                    "state_hash": row.state_hash,
+                    "parent_risk_hash": row.parent_risk_hash,
+                    "row_hash": row.row_hash,
+                }
+                for row in rows
+            ],
         )
 
     def _derive_slippage_rate(self, slippage_param_hash: str) -> Decimal:
@@ -1537,7 +1537,6 @@ CREATE TABLE public.order_book_snapshot (
     best_bid_size numeric(38,18) NOT NULL,
     best_ask_size numeric(38,18) NOT NULL,
     spread_abs numeric(38,18) GENERATED ALWAYS AS ((best_ask_price - best_bid_price)) STORED,
-    spread_bps numeric(12,8) GENERATED ALWAYS AS ((((best_ask_price - best_bid_price) / NULLIF(best_bid_price, (0)::numeric)) * (10000)::numeric)) STORED,
     source_venue text NOT NULL,
     ingest_run_id uuid NOT NULL,
     row_hash character(64) NOT NULL,
@@ -2292,6 +2291,26 @@ CREATE TABLE public.training_universe_version (
 );
 
 
+--
+-- Name: v_order_book_snapshot; Type: VIEW; Schema: public; Owner: -
+--
+
+CREATE VIEW public.v_order_book_snapshot AS
+ SELECT order_book_snapshot.asset_id,
+    order_book_snapshot.snapshot_ts_utc,
+    order_book_snapshot.hour_ts_utc,
+    order_book_snapshot.best_bid_price,
+    order_book_snapshot.best_ask_price,
+    order_book_snapshot.best_bid_size,
+    order_book_snapshot.best_ask_size,
+    order_book_snapshot.spread_abs,
+    (((order_book_snapshot.spread_abs / NULLIF(order_book_snapshot.best_bid_price, (0)::numeric)) * (10000)::numeric))::numeric(12,8) AS spread_bps,
+    order_book_snapshot.source_venue,
+    order_book_snapshot.ingest_run_id,
+    order_book_snapshot.row_hash
+   FROM public.order_book_snapshot;
+
+
 --
 -- Name: cash_ledger cash_ledger_v2_account_id_run_mode_event_ts_utc_ref_type_re_key; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -2529,7 +2548,7 @@ ALTER TABLE ONLY public.feature_definition
 --
 
 ALTER TABLE ONLY public.feature_snapshot
-    ADD CONSTRAINT pk_feature_snapshot PRIMARY KEY (run_id, asset_id, feature_id, hour_ts_utc);
+    ADD CONSTRAINT pk_feature_snapshot PRIMARY KEY (asset_id, feature_id, hour_ts_utc, run_id);
 
 
 --
@@ -2563,6 +2582,8 @@ ALTER TABLE ONLY public.ingestion_watermark_history
 ALTER TABLE ONLY public.market_ohlcv_hourly
     ADD CONSTRAINT pk_market_ohlcv_hourly PRIMARY KEY (asset_id, hour_ts_utc, source_venue);
 
+ALTER TABLE public.market_ohlcv_hourly CLUSTER ON pk_market_ohlcv_hourly;
+
 
 --
 -- Name: meta_learner_component_phase1a_archive pk_meta_learner_component; Type: CONSTRAINT; Schema: public; Owner: -
@@ -3108,6 +3129,83 @@ ALTER TABLE ONLY public.trade_signal
     ADD CONSTRAINT uq_trade_signal_v2_signal_riskrun UNIQUE (signal_id, risk_state_run_id);
 
 
+--
+-- Name: brin_cluster_exposure_hourly_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_cluster_exposure_hourly_hour ON public.cluster_exposure_hourly_state USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_drift_event_triggered; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_drift_event_triggered ON public.drift_event USING brin (triggered_at_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_feature_snapshot_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_feature_snapshot_hour ON public.feature_snapshot USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_hindcast_forecast_metric_measured; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_hindcast_forecast_metric_measured ON public.hindcast_forecast_metric USING brin (measured_at_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_market_ohlcv_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_market_ohlcv_hour ON public.market_ohlcv_hourly USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_model_prediction_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_model_prediction_hour ON public.model_prediction USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_order_book_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_order_book_hour ON public.order_book_snapshot USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_portfolio_hourly_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_portfolio_hourly_hour ON public.portfolio_hourly_state USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_position_hourly_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_position_hourly_hour ON public.position_hourly_state USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_regime_output_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_regime_output_hour ON public.regime_output USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
+--
+-- Name: brin_risk_hourly_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX brin_risk_hourly_hour ON public.risk_hourly_state USING brin (hour_ts_utc) WITH (pages_per_range='32');
+
+
 --
 -- Name: cash_ledger_v2_account_id_event_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -3150,13 +3248,6 @@ CREATE INDEX executed_trade_v2_asset_id_exit_ts_utc_idx ON public.executed_trade
 CREATE INDEX executed_trade_v2_lot_id_idx ON public.executed_trade USING btree (lot_id);
 
 
---
--- Name: feature_snapshot_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
---
-
-CREATE INDEX feature_snapshot_hour_ts_utc_idx ON public.feature_snapshot USING btree (hour_ts_utc DESC);
-
-
 --
 -- Name: idx_account_risk_profile_assignment_account_window; Type: INDEX; Schema: public; Owner: -
 --
@@ -3185,6 +3276,13 @@ CREATE INDEX idx_asset_is_active ON public.asset USING btree (is_active);
 CREATE INDEX idx_automation_event_ts_desc ON public.automation_event_log USING btree (event_ts_utc DESC);
 
 
+--
+-- Name: idx_automation_event_type_ts_desc; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_automation_event_type_ts_desc ON public.automation_event_log USING btree (event_type, event_ts_utc DESC) INCLUDE (status);
+
+
 --
 -- Name: idx_backtest_fold_result_valid_range; Type: INDEX; Schema: public; Owner: -
 --
@@ -3255,6 +3353,13 @@ CREATE INDEX idx_cluster_exposure_hourly_cluster_hour ON public.cluster_exposure
 CREATE INDEX idx_cost_profile_venue_effective_from_desc ON public.cost_profile USING btree (venue, effective_from_utc DESC);
 
 
+--
+-- Name: idx_data_gap_event_pending; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_data_gap_event_pending ON public.data_gap_event USING btree (detected_at_utc) INCLUDE (gap_event_id, symbol, gap_start_ts_utc, gap_end_ts_utc) WHERE (status = 'PENDING'::text);
+
+
 --
 -- Name: idx_dataset_snapshot_generated_desc; Type: INDEX; Schema: public; Owner: -
 --
@@ -3294,7 +3399,7 @@ CREATE INDEX idx_executed_trade_lot_id ON public.executed_trade_phase1a_archive
 -- Name: idx_feature_snapshot_asset_hour_desc; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE INDEX idx_feature_snapshot_asset_hour_desc ON public.feature_snapshot USING btree (asset_id, hour_ts_utc DESC);
+CREATE INDEX idx_feature_snapshot_asset_hour_desc ON public.feature_snapshot USING btree (asset_id, hour_ts_utc DESC) INCLUDE (feature_value);
 
 
 --
@@ -3318,18 +3423,32 @@ CREATE INDEX idx_feature_snapshot_mode_hour_desc ON public.feature_snapshot USIN
 CREATE INDEX idx_hindcast_cycle_symbol_horizon ON public.hindcast_forecast_metric USING btree (training_cycle_id, symbol, horizon, measured_at_utc DESC);
 
 
+--
+-- Name: idx_ingestion_cycle_started_desc; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_ingestion_cycle_started_desc ON public.ingestion_cycle USING btree (started_at_utc DESC) INCLUDE (ingestion_cycle_id);
+
+
+--
+-- Name: idx_ingestion_watermark_cycle; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_ingestion_watermark_cycle ON public.ingestion_watermark_history USING btree (ingestion_cycle_id);
+
+
 --
 -- Name: idx_ingestion_watermark_symbol_ts_desc; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE INDEX idx_ingestion_watermark_symbol_ts_desc ON public.ingestion_watermark_history USING btree (source_name, symbol, watermark_ts_utc DESC);
+CREATE INDEX idx_ingestion_watermark_symbol_ts_desc ON public.ingestion_watermark_history USING btree (source_name, symbol, watermark_ts_utc DESC) INCLUDE (watermark_kind, watermark_cursor, records_ingested);
 
 
 --
--- Name: idx_market_ohlcv_hour_desc; Type: INDEX; Schema: public; Owner: -
+-- Name: idx_meta_component_asset_horizon_hour; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE INDEX idx_market_ohlcv_hour_desc ON public.market_ohlcv_hourly USING btree (hour_ts_utc DESC);
+CREATE INDEX idx_meta_component_asset_horizon_hour ON public.meta_learner_component USING btree (asset_id, horizon, hour_ts_utc DESC) INCLUDE (base_prob_up, component_weight);
 
 
 --
@@ -3346,6 +3465,20 @@ CREATE INDEX idx_meta_component_asset_hour_desc ON public.meta_learner_component
 CREATE INDEX idx_meta_component_meta_model_hour_desc ON public.meta_learner_component_phase1a_archive USING btree (meta_model_version_id, hour_ts_utc DESC);
 
 
+--
+-- Name: idx_model_activation_gate_model_version; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_model_activation_gate_model_version ON public.model_activation_gate USING btree (model_version_id);
+
+
+--
+-- Name: idx_model_prediction_asset_horizon_hour; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_model_prediction_asset_horizon_hour ON public.model_prediction USING btree (asset_id, horizon, hour_ts_utc DESC) INCLUDE (prob_up, expected_return, model_role, model_version_id);
+
+
 --
 -- Name: idx_model_prediction_asset_hour_horizon; Type: INDEX; Schema: public; Owner: -
 --
@@ -3361,31 +3494,31 @@ CREATE INDEX idx_model_prediction_role_hour_desc ON public.model_prediction_phas
 
 
 --
--- Name: idx_model_training_window_valid_range; Type: INDEX; Schema: public; Owner: -
+-- Name: idx_model_training_window_model_version; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE INDEX idx_model_training_window_valid_range ON public.model_training_window USING btree (valid_start_utc, valid_end_utc);
+CREATE INDEX idx_model_training_window_model_version ON public.model_training_window USING btree (model_version_id);
 
 
 --
--- Name: idx_model_version_role_active; Type: INDEX; Schema: public; Owner: -
+-- Name: idx_model_training_window_valid_range; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE INDEX idx_model_version_role_active ON public.model_version USING btree (model_role, is_active);
+CREATE INDEX idx_model_training_window_valid_range ON public.model_training_window USING btree (valid_start_utc, valid_end_utc);
 
 
 --
--- Name: idx_order_book_asset_hour_desc; Type: INDEX; Schema: public; Owner: -
+-- Name: idx_model_version_active_by_role; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE INDEX idx_order_book_asset_hour_desc ON public.order_book_snapshot USING btree (asset_id, hour_ts_utc DESC);
+CREATE INDEX idx_model_version_active_by_role ON public.model_version USING btree (model_role) INCLUDE (model_version_id, model_name) WHERE (is_active = true);
 
 
 --
--- Name: idx_order_book_hour_desc; Type: INDEX; Schema: public; Owner: -
+-- Name: idx_order_book_asset_hour_desc; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE INDEX idx_order_book_hour_desc ON public.order_book_snapshot USING btree (hour_ts_utc DESC);
+CREATE INDEX idx_order_book_asset_hour_desc ON public.order_book_snapshot USING btree (asset_id, hour_ts_utc DESC);
 
 
 --
@@ -3486,6 +3619,13 @@ CREATE INDEX idx_position_lot_remaining_qty ON public.position_lot_phase1a_archi
 CREATE INDEX idx_promotion_decision_cycle_decided_desc ON public.promotion_decision USING btree (training_cycle_id, decided_at_utc DESC);
 
 
+--
+-- Name: idx_raw_trade_chunk_cycle; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_raw_trade_chunk_cycle ON public.raw_trade_chunk_manifest USING btree (ingestion_cycle_id);
+
+
 --
 -- Name: idx_raw_trade_chunk_symbol_day_desc; Type: INDEX; Schema: public; Owner: -
 --
@@ -3535,6 +3675,20 @@ CREATE INDEX idx_risk_event_type_event_ts_desc ON public.risk_event_phase1a_arch
 CREATE INDEX idx_risk_hourly_halt_true_hour_desc ON public.risk_hourly_state USING btree (hour_ts_utc DESC) WHERE (halt_new_entries = true);
 
 
+--
+-- Name: idx_risk_hourly_kill_switch_true_hour_desc; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_risk_hourly_kill_switch_true_hour_desc ON public.risk_hourly_state USING btree (account_id, hour_ts_utc DESC) WHERE (kill_switch_active = true);
+
+
+--
+-- Name: idx_risk_hourly_manual_review_true_hour_desc; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_risk_hourly_manual_review_true_hour_desc ON public.risk_hourly_state USING btree (account_id, hour_ts_utc DESC) WHERE (requires_manual_review = true);
+
+
 --
 -- Name: idx_risk_hourly_source_run_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -3584,6 +3738,20 @@ CREATE INDEX idx_trade_signal_account_hour_desc ON public.trade_signal_phase1a_a
 CREATE INDEX idx_trade_signal_action_hour_desc ON public.trade_signal_phase1a_archive USING btree (action, hour_ts_utc DESC);
 
 
+--
+-- Name: idx_trade_signal_enter_exit_hour_desc; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_trade_signal_enter_exit_hour_desc ON public.trade_signal USING btree (action, hour_ts_utc DESC) WHERE (action = ANY (ARRAY['ENTER'::public.signal_action_enum, 'EXIT'::public.signal_action_enum]));
+
+
+--
+-- Name: idx_training_cycle_kind_started_desc; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_training_cycle_kind_started_desc ON public.training_cycle USING btree (cycle_kind, started_at_utc DESC);
+
+
 --
 -- Name: idx_training_cycle_started_desc; Type: INDEX; Schema: public; Owner: -
 --
@@ -3605,13 +3773,6 @@ CREATE INDEX market_ohlcv_hourly_asset_id_hour_ts_utc_idx ON public.market_ohlcv
 CREATE INDEX meta_learner_component_hour_ts_utc_idx ON public.meta_learner_component_phase1a_archive USING btree (hour_ts_utc DESC);
 
 
---
--- Name: meta_learner_component_v2_asset_id_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
---
-
-CREATE INDEX meta_learner_component_v2_asset_id_hour_ts_utc_idx ON public.meta_learner_component USING btree (asset_id, hour_ts_utc DESC);
-
-
 --
 -- Name: meta_learner_component_v2_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -3640,13 +3801,6 @@ CREATE INDEX model_prediction_asset_id_hour_ts_utc_idx ON public.model_predictio
 CREATE INDEX model_prediction_hour_ts_utc_idx ON public.model_prediction_phase1a_archive USING btree (hour_ts_utc DESC);
 
 
---
--- Name: model_prediction_v2_asset_id_hour_ts_utc_horizon_idx; Type: INDEX; Schema: public; Owner: -
---
-
-CREATE INDEX model_prediction_v2_asset_id_hour_ts_utc_horizon_idx ON public.model_prediction USING btree (asset_id, hour_ts_utc DESC, horizon);
-
-
 --
 -- Name: model_prediction_v2_asset_id_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -3654,13 +3808,6 @@ CREATE INDEX model_prediction_v2_asset_id_hour_ts_utc_horizon_idx ON public.mode
 CREATE INDEX model_prediction_v2_asset_id_hour_ts_utc_idx ON public.model_prediction USING btree (asset_id, hour_ts_utc DESC);
 
 
---
--- Name: model_prediction_v2_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
---
-
-CREATE INDEX model_prediction_v2_hour_ts_utc_idx ON public.model_prediction USING btree (hour_ts_utc DESC);
-
-
 --
 -- Name: model_prediction_v2_model_role_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -3672,7 +3819,7 @@ CREATE INDEX model_prediction_v2_model_role_hour_ts_utc_idx ON public.model_pred
 -- Name: model_prediction_v2_run_id_asset_id_horizon_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE UNIQUE INDEX model_prediction_v2_run_id_asset_id_horizon_hour_ts_utc_idx ON public.model_prediction USING btree (run_id, asset_id, horizon, hour_ts_utc) WHERE (model_role = 'META'::public.model_role_enum);
+CREATE UNIQUE INDEX model_prediction_v2_run_id_asset_id_horizon_hour_ts_utc_idx ON public.model_prediction USING btree (run_id, asset_id, horizon, hour_ts_utc) INCLUDE (prob_up, expected_return, model_version_id) WHERE (model_role = 'META'::public.model_role_enum);
 
 
 --
@@ -3759,13 +3906,6 @@ CREATE INDEX regime_output_hour_ts_utc_idx ON public.regime_output_phase1a_archi
 CREATE INDEX regime_output_v2_asset_id_hour_ts_utc_idx ON public.regime_output USING btree (asset_id, hour_ts_utc DESC);
 
 
---
--- Name: regime_output_v2_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
---
-
-CREATE INDEX regime_output_v2_hour_ts_utc_idx ON public.regime_output USING btree (hour_ts_utc DESC);
-
-
 --
 -- Name: regime_output_v2_regime_label_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -3808,13 +3948,6 @@ CREATE INDEX risk_hourly_state_account_id_hour_ts_utc_idx ON public.risk_hourly_
 CREATE INDEX trade_signal_v2_account_id_hour_ts_utc_idx ON public.trade_signal USING btree (account_id, hour_ts_utc DESC);
 
 
---
--- Name: trade_signal_v2_action_hour_ts_utc_idx; Type: INDEX; Schema: public; Owner: -
---
-
-CREATE INDEX trade_signal_v2_action_hour_ts_utc_idx ON public.trade_signal USING btree (action, hour_ts_utc DESC);
-
-
 --
 -- Name: uqix_cost_profile_one_active_per_venue; Type: INDEX; Schema: public; Owner: -
 --
@@ -3826,7 +3959,7 @@ CREATE UNIQUE INDEX uqix_cost_profile_one_active_per_venue ON public.cost_profil
 -- Name: uqix_model_activation_gate_one_approved; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE UNIQUE INDEX uqix_model_activation_gate_one_approved ON public.model_activation_gate USING btree (model_version_id, run_mode) WHERE (status = 'APPROVED'::text);
+CREATE UNIQUE INDEX uqix_model_activation_gate_one_approved ON public.model_activation_gate USING btree (model_version_id, run_mode) INCLUDE (activation_id, validation_backtest_run_id, validation_window_end_utc, approval_hash) WHERE (status = 'APPROVED'::text);
 
 
 --
@@ -3840,7 +3973,7 @@ CREATE UNIQUE INDEX uqix_model_prediction_meta_per_run_asset_horizon_hour ON pub
 -- Name: uqix_model_version_one_active_per_name_role; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE UNIQUE INDEX uqix_model_version_one_active_per_name_role ON public.model_version USING btree (model_name, model_role) WHERE (is_active = true);
+CREATE UNIQUE INDEX uqix_model_version_one_active_per_name_role ON public.model_version USING btree (model_name, model_role) INCLUDE (model_version_id, mlflow_model_uri, mlflow_run_id, feature_set_version, hyperparams_hash, training_data_hash) WHERE (is_active = true);
 
 
 --
@@ -4826,20 +4959,12 @@ ALTER TABLE ONLY public.portfolio_hourly_state
     ADD CONSTRAINT fk_portfolio_hourly_state_account FOREIGN KEY (account_id) REFERENCES public.account(account_id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
 
---
--- Name: portfolio_hourly_state fk_portfolio_hourly_state_run_context; Type: FK CONSTRAINT; Schema: public; Owner: -
---
-
-ALTER TABLE ONLY public.portfolio_hourly_state
-    ADD CONSTRAINT fk_portfolio_hourly_state_run_context FOREIGN KEY (source_run_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT;
-
-
 --
 -- Name: portfolio_hourly_state fk_portfolio_hourly_state_run_context_account_hour; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
 
 ALTER TABLE ONLY public.portfolio_hourly_state
-    ADD CONSTRAINT fk_portfolio_hourly_state_run_context_account_hour FOREIGN KEY (source_run_id, account_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, account_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT NOT VALID;
+    ADD CONSTRAINT fk_portfolio_hourly_state_run_context_account_hour FOREIGN KEY (source_run_id, account_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, account_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
 
 --
@@ -4858,20 +4983,12 @@ ALTER TABLE ONLY public.position_hourly_state
     ADD CONSTRAINT fk_position_hourly_state_asset FOREIGN KEY (asset_id) REFERENCES public.asset(asset_id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
 
---
--- Name: position_hourly_state fk_position_hourly_state_run_context; Type: FK CONSTRAINT; Schema: public; Owner: -
---
-
-ALTER TABLE ONLY public.position_hourly_state
-    ADD CONSTRAINT fk_position_hourly_state_run_context FOREIGN KEY (source_run_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT;
-
-
 --
 -- Name: position_hourly_state fk_position_hourly_state_run_context_account_hour; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
 
 ALTER TABLE ONLY public.position_hourly_state
-    ADD CONSTRAINT fk_position_hourly_state_run_context_account_hour FOREIGN KEY (source_run_id, account_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, account_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT NOT VALID;
+    ADD CONSTRAINT fk_position_hourly_state_run_context_account_hour FOREIGN KEY (source_run_id, account_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, account_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
 
 --
@@ -5082,20 +5199,12 @@ ALTER TABLE ONLY public.risk_hourly_state
     ADD CONSTRAINT fk_risk_hourly_state_portfolio_identity FOREIGN KEY (run_mode, account_id, hour_ts_utc) REFERENCES public.portfolio_hourly_state_identity(run_mode, account_id, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
 
---
--- Name: risk_hourly_state fk_risk_hourly_state_run_context; Type: FK CONSTRAINT; Schema: public; Owner: -
---
-
-ALTER TABLE ONLY public.risk_hourly_state
-    ADD CONSTRAINT fk_risk_hourly_state_run_context FOREIGN KEY (source_run_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT;
-
-
 --
 -- Name: risk_hourly_state fk_risk_hourly_state_run_context_account_hour; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
 
 ALTER TABLE ONLY public.risk_hourly_state
-    ADD CONSTRAINT fk_risk_hourly_state_run_context_account_hour FOREIGN KEY (source_run_id, account_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, account_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT NOT VALID;
+    ADD CONSTRAINT fk_risk_hourly_state_run_context_account_hour FOREIGN KEY (source_run_id, account_id, run_mode, hour_ts_utc) REFERENCES public.run_context(run_id, account_id, run_mode, hour_ts_utc) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
 
 --
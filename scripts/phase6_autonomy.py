@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
@@ -35,6 +36,7 @@ from execution.phase6.universe_manager import (
 _NAMED_PARAM_RE = re.compile(r"(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)")
 
 
+@lru_cache(maxsize=512)
 def _convert_named_params(sql: str) -> str:
     return _NAMED_PARAM_RE.sub(r"%(\1)s", sql)
 
@@ -47,6 +49,14 @@ def _parse_ts(value: str) -> datetime:
     return ts.astimezone(timezone.utc)
 
 
+def _parse_month(value: str) -> datetime:
+    try:
+        month = datetime.strptime(value.strip(), "%Y-%m")
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("Month must be formatted as YYYY-MM.") from exc
+    return month.replace(tzinfo=timezone.utc)
+
+
 class PsycopgPhase6DB:
     """Minimal DB adapter for Phase 6 modules."""
 
@@ -68,6 +78,11 @@ class PsycopgPhase6DB:
         with self.conn.cursor() as cur:
             cur.execute(converted, dict(params))
 
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        converted = _convert_named_params(sql)
+        with self.conn.cursor() as cur:
+            cur.executemany(converted, [dict(params) for params in params_seq])
+
 
 def _resolve_connection(args: argparse.Namespace) -> psycopg.Connection[Any]:
     if args.dsn:
@@ -175,6 +190,8 @@ def _build_parser() -> argparse.ArgumentParser:
     subparsers.add_parser("sync-now", help="Run incremental sync cycle")
     subparsers.add_parser("train-now", help="Run scheduled training cycle")
     subparsers.add_parser("repair-gaps", help="Run gap repair cycle")
+    archive = subparsers.add_parser("archive-ohlcv", help="Export one closed UTC month of OHLCV bars to parquet")
+    archive.add_argument("--month", type=_parse_month, required=True, help="UTC month as YYYY-MM")
     subparsers.add_parser("status", help="Get daemon status")
 
     return parser
@@ -245,6 +262,15 @@ def main() -> int:
             conn.commit()
             return 0
 
+        if args.command == "archive-ohlcv":
+            daemon.acquire_exclusive_lock()
+            try:
+                daemon.run_ohlcv_archive(month_start_utc=args.month)
+            finally:
+                daemon.release_exclusive_lock()
+            conn.commit()
+            return 0
+
         if args.command == "run-once":
             daemon.run_once()
             conn.commit()
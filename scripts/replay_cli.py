@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
@@ -33,6 +34,7 @@ from execution.replay_harness import (
 _NAMED_PARAM_RE = re.compile(r"(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)")
 
 
+@lru_cache(maxsize=512)
 def _convert_named_params(sql: str) -> str:
     return _NAMED_PARAM_RE.sub(r"%(\1)s", sql)
 
@@ -85,6 +87,11 @@ class PsycopgRuntimeDB:
         with self.conn.cursor() as cur:
             cur.execute(converted, dict(params))
 
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        converted = _convert_named_params(sql)
+        with self.conn.cursor() as cur:
+            cur.executemany(converted, [dict(params) for params in params_seq])
+
 
 def _resolve_connection(args: argparse.Namespace) -> psycopg.Connection[Any]:
     if args.dsn:
@@ -107,6 +107,15 @@ def test_sql_execute_set_runs_and_returns_expected_checks(sql_artifact_conn: Any
     assert trigger_v2_rows, "Repair trigger script did not return triggers_with_v2_refs rows."
     assert int(trigger_v2_rows[-1]["triggers_with_v2_refs"]) == 0
 
+    for relative_path in (
+        "docs/repairs/HOURLY_STATE_RUN_CONTEXT_FK_REPAIR.sql",
+        "docs/repairs/ORDER_BOOK_SPREAD_BPS_VIEW_REPAIR.sql",
+        "docs/repairs/FEATURE_SNAPSHOT_PRIMARY_KEY_REPAIR.sql",
+    ):
+        rows = execute_sql_file(sql_artifact_conn, ROOT / relative_path)
+        assert_check_rows_are_zero(rows, source=relative_path)
+        sql_artifact_conn.commit()
+
     for relative_path in (
         "docs/validations/PHASE_1C_VALIDATION.sql",
         "docs/validations/PHASE_1D_RUNTIME_VALIDATION.sql",
@@ -126,6 +135,9 @@ def test_sql_execute_set_runs_and_returns_expected_checks(sql_artifact_conn: Any
         "schema_bootstrap.sql",
         "docs/repairs/PHASE_1C_REVISION_C_SCHEMA_REPAIR_BLUEPRINT.sql",
         "docs/repairs/PHASE_1C_REVISION_C_TRIGGER_REPAIR.sql",
+        "docs/repairs/HOURLY_STATE_RUN_CONTEXT_FK_REPAIR.sql",
+        "docs/repairs/ORDER_BOOK_SPREAD_BPS_VIEW_REPAIR.sql",
+        "docs/repairs/FEATURE_SNAPSHOT_PRIMARY_KEY_REPAIR.sql",
         "docs/validations/PHASE_1C_VALIDATION.sql",
         "docs/validations/PHASE_1D_RUNTIME_VALIDATION.sql",
         "docs/validations/PHASE_2_REPLAY_HARNESS_VALIDATION.sql",
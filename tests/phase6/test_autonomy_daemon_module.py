@@ -54,6 +54,7 @@ def _config(local_cache_dir: Path, **overrides) -> Phase6Config:  # type: ignore
         daemon_lock_stale_seconds=900,
         daemon_failure_backoff_seconds=2,
         daemon_max_consecutive_failures=3,
+        ohlcv_archive_grace_hours=24,
     )
     base.update(overrides)
     return Phase6Config(**base)
@@ -196,22 +197,24 @@ def test_run_once_and_daemon_loop(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
     calls: list[str] = []
     monkeypatch.setattr(d, "run_incremental_sync", lambda: calls.append("sync"))
     monkeypatch.setattr(d, "run_gap_repair", lambda: calls.append("repair"))
+    monkeypatch.setattr(d, "maybe_run_ohlcv_archive", lambda: calls.append("archive") or True)
     monkeypatch.setattr(d, "bootstrap_complete", lambda: True)
     monkeypatch.setattr(d, "_scheduled_training_already_ran_today", lambda _now: False)
     monkeypatch.setattr(d, "run_training", lambda cycle_kind="": calls.append(f"train:{cycle_kind}"))
     d.run_once()
-    assert calls == ["sync", "repair", "train:SCHEDULED"]
+    assert calls == ["sync", "repair", "archive", "train:SCHEDULED"]
 
     d2 = _daemon(FakeDB(), local_cache_dir=tmp_path / "d2", now_hour=0)
     calls2: list[str] = []
     monkeypatch.setattr(d2, "run_incremental_sync", lambda: calls2.append("sync"))
     monkeypatch.setattr(d2, "run_gap_repair", lambda: calls2.append("repair"))
+    monkeypatch.setattr(d2, "maybe_run_ohlcv_archive", lambda: calls2.append("archive") or False)
     monkeypatch.setattr(d2, "bootstrap_complete", lambda: True)
     monkeypatch.setattr(d2, "_scheduled_training_already_ran_today", lambda _now: True)
     monkeypatch.setattr(d2, "run_training", lambda cycle_kind="": calls2.append(f"train:{cycle_kind}"))
     monkeypatch.setattr(d2, "maybe_trigger_drift_training", lambda: calls2.append("drift") or False)
     d2.run_once()
-    assert calls2 == ["sync", "repair"]
+    assert calls2 == ["sync", "repair", "archive"]
 
     sleep_calls: list[int] = []
     d3 = _daemon(FakeDB(), local_cache_dir=tmp_path / "d3", cfg=_config(tmp_path / "d3", ingestion_loop_seconds=7))
@@ -252,14 +255,7 @@ def test_drift_observation_and_feature_psi_math(tmp_path: Path) -> None:
         {"sample_count": 48, "avg_accuracy": Decimal("0.60"), "avg_ece": Decimal("0.02")},
     )
     db.set_all(
-        "FROM dataset_snapshot\n            ORDER BY generated_at_utc DESC",
-        [
-            {"dataset_snapshot_id": "new"},
-            {"dataset_snapshot_id": "old"},
-        ],
-    )
-    db.set_all(
-        "FROM dataset_snapshot_component",
+        "LEFT JOIN dataset_snapshot_component",
         [
             {"dataset_snapshot_id": "new", "symbol": "BTC", "component_row_count": 60},
             {"dataset_snapshot_id": "new", "symbol": "ETH", "component_row_count": 40},
@@ -454,26 +450,25 @@ def test_schedule_cooldown_and_status_none_paths(tmp_path: Path) -> None:
 
 
 def test_feature_psi_edge_paths(tmp_path: Path) -> None:
+    db_empty = FakeDB()
+    d_empty = _daemon(db_empty, local_cache_dir=tmp_path / "empty")
+    assert d_empty._compute_feature_psi() == Decimal("0")
+
     db_short = FakeDB()
     d_short = _daemon(db_short, local_cache_dir=tmp_path / "short")
     db_short.set_all(
-        "FROM dataset_snapshot\n            ORDER BY generated_at_utc DESC",
-        [{"dataset_snapshot_id": "only-one"}],
+        "LEFT JOIN dataset_snapshot_component",
+        [{"dataset_snapshot_id": "only-one", "symbol": "BTC", "component_row_count": 10}],
     )
     assert d_short._compute_feature_psi() == Decimal("0")
 
     db_zero = FakeDB()
     d_zero = _daemon(db_zero, local_cache_dir=tmp_path / "zero")
     db_zero.set_all(
-        "FROM dataset_snapshot\n            ORDER BY generated_at_utc DESC",
-        [{"dataset_snapshot_id": "new"}, {"dataset_snapshot_id": "old"}],
-    )
-    db_zero.set_all(
-        "FROM dataset_snapshot_component",
+        "LEFT JOIN dataset_snapshot_component",
         [
-            {"dataset_snapshot_id": "other", "symbol": "BTC", "component_row_count": 10},
             {"dataset_snapshot_id": "new", "symbol": "BTC", "component_row_count": 0},
-            {"dataset_snapshot_id": "old", "symbol": "BTC", "component_row_count": 0},
+            {"dataset_snapshot_id": "old", "symbol": None, "component_row_count": None},
         ],
     )
     assert d_zero._compute_feature_psi() == Decimal("0")
@@ -485,10 +480,11 @@ def test_run_once_cycle_branch_paths(tmp_path: Path, monkeypatch: pytest.MonkeyP
     calls: list[str] = []
     monkeypatch.setattr(d, "run_incremental_sync", lambda: calls.append("sync"))
     monkeypatch.setattr(d, "run_gap_repair", lambda: calls.append("repair"))
+    monkeypatch.setattr(d, "maybe_run_ohlcv_archive", lambda: calls.append("archive") or False)
     monkeypatch.setattr(d, "bootstrap_complete", lambda: True)
     monkeypatch.setattr(d, "maybe_trigger_drift_training", lambda: calls.append("drift") or True)
     d._run_once_cycle()
-    assert calls == ["repair", "drift"]
+    assert calls == ["repair", "archive", "drift"]
 
     d_no_bootstrap = _daemon(FakeDB(), local_cache_dir=tmp_path / "noboot", cfg=cfg, now_hour=1)
     calls_no_bootstrap: list[str] = []
@@ -503,9 +499,73 @@ def test_run_once_cycle_branch_paths(tmp_path: Path, monkeypatch: pytest.MonkeyP
     calls_disabled: list[str] = []
     monkeypatch.setattr(d_disabled, "run_incremental_sync", lambda: calls_disabled.append("sync"))
     monkeypatch.setattr(d_disabled, "run_gap_repair", lambda: calls_disabled.append("repair"))
+    monkeypatch.setattr(d_disabled, "maybe_run_ohlcv_archive", lambda: calls_disabled.append("archive") or False)
     monkeypatch.setattr(d_disabled, "bootstrap_complete", lambda: True)
     d_disabled._run_once_cycle()
-    assert calls_disabled == ["sync", "repair"]
+    assert calls_disabled == ["sync", "repair", "archive"]
+
+
+def test_ohlcv_archive_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db = FakeDB()
+    d = _daemon(db, local_cache_dir=tmp_path)
+    month_start = datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(
+        "execution.phase6.autonomy_daemon.export_ohlcv_month_to_parquet",
+        lambda _db, **_kwargs: SimpleNamespace(row_count=48, export_hash="e" * 64, file_sha256="f" * 64),
+    )
+    d.run_ohlcv_archive(month_start_utc=month_start)
+    assert db.executed[-1][1]["status"] == "COMPLETED"
+    assert db.executed[-1][1]["details"] == f"month=2025-12,rows=48,export_hash={'e' * 64},file_sha256={'f' * 64}"
+
+    monkeypatch.setattr("execution.phase6.autonomy_daemon.export_ohlcv_month_to_parquet", lambda _db, **_kwargs: None)
+    d.run_ohlcv_archive(month_start_utc=month_start)
+    assert (db.executed[-1][1]["status"], db.executed[-1][1]["details"]) == ("SKIPPED", "month=2025-12,rows=0")
+
+    monkeypatch.setattr(
+        "execution.phase6.autonomy_daemon.export_ohlcv_month_to_parquet",
+        lambda _db, **_kwargs: (_ for _ in ()).throw(RuntimeError("disk")),
+    )
+    with pytest.raises(RuntimeError, match="disk"):
+        d.run_ohlcv_archive(month_start_utc=month_start)
+    assert db.executed[-1][1]["status"] == "FAILED"
+
+    archived: list[datetime] = []
+    monkeypatch.setattr(d, "run_ohlcv_archive", lambda *, month_start_utc: archived.append(month_start_utc))
+    current_hash = {"value": "h1"}
+    monkeypatch.setattr(
+        "execution.phase6.autonomy_daemon.ohlcv_month_export_hash",
+        lambda _db, *, month_start_utc: current_hash["value"],
+    )
+
+    # Inside the grace window the closed month is left alone.
+    assert d.maybe_run_ohlcv_archive() is False
+    d._clock = _FixedClock(datetime(2026, 1, 2, 0, tzinfo=timezone.utc))  # type: ignore[attr-defined]
+
+    db.set_one("FROM data_gap_event", {"n": 1})
+    assert d.maybe_run_ohlcv_archive() is False
+    db.set_one("FROM data_gap_event", {"n": 0})
+
+    current_hash["value"] = None  # type: ignore[assignment]
+    assert d.maybe_run_ohlcv_archive() is False
+    current_hash["value"] = "h1"
+
+    assert d._last_ohlcv_archive_export_hash("2025-12") is None
+    assert d.maybe_run_ohlcv_archive() is True
+    assert archived == [month_start]
+
+    db.set_one("FROM automation_event_log", {"details": "month=2025-12,rows=48,export_hash=h1,file_sha256=f"})
+    assert d._last_ohlcv_archive_export_hash("2025-12") == "h1"
+    assert d.maybe_run_ohlcv_archive() is False
+    assert archived == [month_start]
+
+    # Late or repaired bars change the month digest, so the month is exported again.
+    current_hash["value"] = "h2"
+    assert d.maybe_run_ohlcv_archive() is True
+    assert archived == [month_start, month_start]
+
+    d_no_gap_row = _daemon(FakeDB(), local_cache_dir=tmp_path / "nogap")
+    assert d_no_gap_row._ohlcv_month_has_pending_gaps(month_start, datetime(2026, 1, 1, tzinfo=timezone.utc)) is False
 
 
 def test_manual_training_with_data_refresh_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import builtins
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from hashlib import sha256
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -12,6 +13,7 @@ import pytest
 from execution.phase6.dataset_materializer import _load_symbol_trade_frames, materialize_tick_canonical_dataset
 from execution.phase6.feature_pipeline import build_tick_features
 from execution.phase6.label_builder import build_horizon_labels
+from execution.phase6.ohlcv_archive import export_ohlcv_month_to_parquet, ohlcv_month_export_hash
 from execution.phase6.provider_contract import TradeTick
 from execution.phase6.trade_archive import archive_trade_ticks, persist_trade_chunk_manifest
 from tests.phase6.utils import FakeDB
@@ -65,6 +67,10 @@ def test_trade_archive_and_manifest_persistence(tmp_path: Path) -> None:
     db = FakeDB()
     persist_trade_chunk_manifest(db, ingestion_cycle_id="cycle-1", source="COINAPI", symbol="BTC", chunks=chunks)
     assert len(db.executed) == 1
+    assert len(db.batches) == 1
+
+    persist_trade_chunk_manifest(db, ingestion_cycle_id="cycle-1", source="COINAPI", symbol="BTC", chunks=())
+    assert len(db.batches) == 1
 
     db_empty = FakeDB()
     persist_trade_chunk_manifest(db_empty, ingestion_cycle_id="cycle-1", source="COINAPI", symbol="BTC", chunks=())
@@ -121,6 +127,9 @@ def test_dataset_materializer_success(tmp_path: Path) -> None:
     assert result.symbol_count == 2
     assert result.output_path.exists()
     assert len(db.executed) == 1 + 2
+    assert len(db.batches) == 1
+    assert "dataset_snapshot_component" in db.batches[0][0]
+    assert db.batches[0][1] == 2
 
 
 def test_feature_pipeline_and_labels_success_and_errors(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -162,3 +171,104 @@ def test_feature_pipeline_and_labels_success_and_errors(monkeypatch: pytest.Monk
     labels = build_horizon_labels(features.frame)
     assert not labels.frame.empty
     assert labels.label_hash
+
+
+def _ohlcv_row(asset_id: int, hour: datetime, close: str) -> dict[str, object]:
+    return {
+        "asset_id": asset_id,
+        "hour_ts_utc": hour,
+        "open_price": Decimal("1"),
+        "high_price": Decimal("2"),
+        "low_price": Decimal("0.5"),
+        "close_price": Decimal(close),
+        "volume_base": Decimal("10"),
+        "volume_quote": Decimal("12.000000000000000001"),
+        "trade_count": 3,
+        "source_venue": "COINAPI",
+        "row_hash": f"{asset_id}{close}".ljust(64, "0"),
+    }
+
+
+def test_ohlcv_parquet_export_guards(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    db = FakeDB()
+    with pytest.raises(RuntimeError, match="first instant"):
+        export_ohlcv_month_to_parquet(db, base_dir=tmp_path, month_start_utc=datetime(2026, 1, 2, tzinfo=timezone.utc))
+    assert export_ohlcv_month_to_parquet(db, base_dir=tmp_path, month_start_utc=datetime(2026, 12, 1, tzinfo=timezone.utc)) is None
+
+    _raise_missing_import(monkeypatch, "pyarrow")
+    with pytest.raises(RuntimeError, match="pyarrow is required"):
+        export_ohlcv_month_to_parquet(db, base_dir=tmp_path, month_start_utc=datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+
+def test_ohlcv_parquet_export_writes_sorted_zstd_month(tmp_path: Path) -> None:
+    import pyarrow.parquet as pq
+
+    db = FakeDB()
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    db.set_all(
+        "FROM market_ohlcv_hourly",
+        [_ohlcv_row(1, start, "1.5"), _ohlcv_row(1, start + timedelta(hours=1), "1.6"), _ohlcv_row(2, start, "7")],
+    )
+
+    result = export_ohlcv_month_to_parquet(db, base_dir=tmp_path, month_start_utc=start)
+    assert result is not None
+    assert result.month_utc == "2026-01"
+    assert result.row_count == 3
+    assert result.min_hour_ts_utc == start
+    assert result.max_hour_ts_utc == start + timedelta(hours=1)
+    assert result.file_path.parent == tmp_path / "market_ohlcv_hourly" / "month=2026-01"
+
+    parquet_file = pq.ParquetFile(result.file_path)
+    assert parquet_file.metadata.row_group(0).column(0).compression == "ZSTD"
+    table = parquet_file.read()
+    assert table.column("asset_id").to_pylist() == [1, 1, 2]
+    assert table.column("volume_quote").to_pylist()[0] == Decimal("12.000000000000000001")
+
+    again = export_ohlcv_month_to_parquet(db, base_dir=tmp_path, month_start_utc=start)
+    assert again == result
+
+
+def test_ohlcv_parquet_reexport_replaces_month_file(tmp_path: Path) -> None:
+    import pyarrow.parquet as pq
+
+    db = FakeDB()
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = [_ohlcv_row(1, start, "1.5"), _ohlcv_row(2, start, "7")]
+    db.set_all("FROM market_ohlcv_hourly", rows)
+    first = export_ohlcv_month_to_parquet(db, base_dir=tmp_path, month_start_utc=start)
+    assert first is not None
+
+    rows.append(_ohlcv_row(1, start + timedelta(hours=1), "1.6"))
+    second = export_ohlcv_month_to_parquet(db, base_dir=tmp_path, month_start_utc=start)
+    assert second is not None
+    assert second.export_hash != first.export_hash
+
+    month_dir = tmp_path / "market_ohlcv_hourly" / "month=2026-01"
+    assert sorted(path.name for path in month_dir.iterdir()) == ["part.parquet"]
+    assert pq.ParquetFile(month_dir / "part.parquet").metadata.num_rows == 3 == second.row_count
+
+
+def test_ohlcv_month_export_hash_matches_export(tmp_path: Path) -> None:
+    db = FakeDB()
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = [_ohlcv_row(1, start, "1.5"), _ohlcv_row(1, start + timedelta(hours=1), "1.6"), _ohlcv_row(2, start, "7")]
+    assert ohlcv_month_export_hash(db, month_start_utc=start) is None
+    db.set_all("FROM market_ohlcv_hourly", rows)
+    exported = export_ohlcv_month_to_parquet(db, base_dir=tmp_path, month_start_utc=start)
+    assert exported is not None
+
+    db.set_one(
+        "AS rows_digest",
+        {
+            "row_count": 3,
+            "min_hour_ts_utc": start,
+            "max_hour_ts_utc": start + timedelta(hours=1),
+            "rows_digest": sha256("|".join(str(row["row_hash"]) for row in rows).encode("utf-8")).hexdigest(),
+        },
+    )
+    assert ohlcv_month_export_hash(db, month_start_utc=start) == exported.export_hash
+
+    db.set_one("AS rows_digest", {"row_count": 0, "min_hour_ts_utc": None, "max_hour_ts_utc": None, "rows_digest": None})
+    assert ohlcv_month_export_hash(db, month_start_utc=start) is None
+    with pytest.raises(RuntimeError, match="first instant"):
+        ohlcv_month_export_hash(db, month_start_utc=start + timedelta(days=1))
@@ -106,6 +106,24 @@ def test_bootstrap_backfill_success(monkeypatch: pytest.MonkeyPatch, tmp_path: P
     assert result.bars_written >= 1
     assert result.trades_archived >= 1
     assert len(db.executed) >= 4
+    assert sum(1 for sql, _ in db.batches if "ingestion_watermark_history" in sql) == 1
+
+
+def test_bootstrap_backfill_empty_universe_writes_only_cycle_rows() -> None:
+    db = FakeDB()
+    result = run_bootstrap_backfill(
+        db=db,
+        provider=_Provider(),
+        universe_symbols=(),
+        asset_id_by_symbol={},
+        local_cache_dir=".",
+        start_ts_utc=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        end_ts_utc=datetime(2026, 1, 2, tzinfo=timezone.utc),
+    )
+    assert result.completed is True
+    assert result.symbols_completed == 0
+    assert db.batches == []
+    assert len(db.executed) == 2
 
 
 def test_persist_ohlcv_rows_empty_and_nonempty() -> None:
@@ -129,6 +147,7 @@ def test_persist_ohlcv_rows_empty_and_nonempty() -> None:
     )
     assert _persist_ohlcv_rows(db, ingest_run_id="r2", asset_id=1, bars=bars) == 1
     assert len(db.executed) == 1
+    assert len(db.batches) == 1
 
 
 def test_latest_trade_watermark_branches() -> None:
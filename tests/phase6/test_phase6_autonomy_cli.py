@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from datetime import datetime, timezone
 import importlib.util
 import json
 from pathlib import Path
@@ -39,6 +40,9 @@ class _FakeCursor:
     def execute(self, sql: str, params: Any = None) -> None:
         self._conn.executed.append((sql, params, self._row_factory))
 
+    def executemany(self, sql: str, params_seq: Any) -> None:
+        self._conn.executed.append((sql, params_seq, self._row_factory))
+
     def fetchall(self) -> list[dict[str, Any]]:
         return list(self._conn.fetchall_rows)
 
@@ -87,10 +91,15 @@ def test_import_path_branch_and_main_guard(monkeypatch: pytest.MonkeyPatch) -> N
 def test_helpers_convert_and_parse_and_db_adapter() -> None:
     cli = _load_cli_module("phase6_autonomy_cli_helpers")
     assert cli._convert_named_params("x=:x AND y::int = 1") == "x=%(x)s AND y::int = 1"
+    assert cli._convert_named_params("x=:x AND y::int = 1") == "x=%(x)s AND y::int = 1"
+    assert cli._convert_named_params.cache_info().hits == 1
     parsed = cli._parse_ts("2026-01-01T00:00:00Z")
     assert parsed.isoformat() == "2026-01-01T00:00:00+00:00"
     with pytest.raises(argparse.ArgumentTypeError, match="timezone"):
         cli._parse_ts("2026-01-01T00:00:00")
+    assert cli._parse_month("2025-12").isoformat() == "2025-12-01T00:00:00+00:00"
+    with pytest.raises(argparse.ArgumentTypeError, match="YYYY-MM"):
+        cli._parse_month("2025-12-01")
 
     conn = _FakeConnection(rows=[{"a": 1}])
     db = cli.PsycopgPhase6DB(conn)
@@ -98,6 +107,8 @@ def test_helpers_convert_and_parse_and_db_adapter() -> None:
     assert db.fetch_all("SELECT :a, :b", {"a": 1, "b": 2}) == [{"a": 1}]
     db.execute("UPDATE t SET x = :x", {"x": 1})
     assert conn.executed[-1][0] == "UPDATE t SET x = %(x)s"
+    db.execute_many("INSERT INTO t VALUES (:x)", ({"x": 1}, {"x": 2}))
+    assert conn.executed[-1][:2] == ("INSERT INTO t VALUES (%(x)s)", [{"x": 1}, {"x": 2}])
 
 
 def test_connection_resolution_and_parser(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -184,6 +195,7 @@ def test_universe_helpers_and_build_daemon(monkeypatch: pytest.MonkeyPatch) -> N
         ("sync-now", 0),
         ("train-now", 0),
         ("repair-gaps", 0),
+        ("archive-ohlcv", 0),
         ("run-once", 0),
         ("daemon", 0),
     ],
@@ -202,6 +214,7 @@ def test_main_command_paths(command: str, expected: int, monkeypatch: pytest.Mon
         max_cycles=1,
         start_ts_utc=None,
         end_ts_utc=None,
+        month=datetime(2025, 12, 1, tzinfo=timezone.utc),
     )
     daemon = SimpleNamespace(
         get_status=lambda: SimpleNamespace(
@@ -216,6 +229,7 @@ def test_main_command_paths(command: str, expected: int, monkeypatch: pytest.Mon
         run_training=lambda cycle_kind="": None,
         run_manual_training_with_data_refresh=lambda: None,
         run_gap_repair=lambda: None,
+        run_ohlcv_archive=lambda **_kwargs: None,
         run_once=lambda: None,
         daemon_loop=lambda max_cycles=None: None,
         acquire_exclusive_lock=lambda: None,
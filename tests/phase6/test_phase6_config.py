@@ -48,6 +48,7 @@ def test_load_phase6_config_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
     assert cfg.daemon_lock_stale_seconds == 900
     assert cfg.daemon_failure_backoff_seconds == 120
     assert cfg.daemon_max_consecutive_failures == 10
+    assert cfg.ohlcv_archive_grace_hours == 24
 
 
 
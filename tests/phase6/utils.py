@@ -11,6 +11,7 @@ class FakeDB:
 
     def __init__(self) -> None:
         self.executed: list[tuple[str, dict[str, Any]]] = []
+        self.batches: list[tuple[str, int]] = []
         self.one_responses: dict[str, Mapping[str, Any] | None] = {}
         self.all_responses: dict[str, Sequence[Mapping[str, Any]]] = {}
 
@@ -35,3 +36,8 @@ class FakeDB:
 
     def execute(self, sql: str, params: Mapping[str, Any]) -> None:
         self.executed.append((sql, dict(params)))
+
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        self.batches.append((sql, len(params_seq)))
+        for params in params_seq:
+            self.execute(sql, params)
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from execution.activation_gate import ActivationRecord, enforce_activation_gate
+import pytest
+
+from execution.activation_gate import ActivationGateResult, ActivationRecord, enforce_activation_gate
 
 
 def test_backtest_without_activation_is_allowed() -> None:
@@ -141,3 +143,36 @@ def test_live_activation_happy_path_allowed() -> None:
     )
     assert result.allowed is True
     assert result.reason_code == "OK"
+
+
+def test_gate_outcomes_are_shared_immutable_results() -> None:
+    kwargs = {
+        "run_mode": "LIVE",
+        "hour_ts_utc": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "model_version_id": 11,
+        "activation": None,
+    }
+    assert enforce_activation_gate(**kwargs) is enforce_activation_gate(**kwargs)
+
+
+def test_gate_records_are_slotted() -> None:
+    activation = ActivationRecord(
+        activation_id=1,
+        model_version_id=11,
+        run_mode="LIVE",
+        validation_window_end_utc=datetime(2025, 12, 31, tzinfo=timezone.utc),
+        status="APPROVED",
+        approval_hash="a" * 64,
+    )
+    result = enforce_activation_gate(
+        run_mode="BACKTEST",
+        hour_ts_utc=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        model_version_id=11,
+        activation=None,
+    )
+    assert isinstance(result, ActivationGateResult)
+    for instance in (activation, result):
+        assert not hasattr(instance, "__dict__")
+        # Python 3.11 frozen+slots dataclasses raise TypeError here; later versions raise AttributeError.
+        with pytest.raises((AttributeError, TypeError)):
+            instance.unexpected_attribute = True  # type: ignore[attr-defined]
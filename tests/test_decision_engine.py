@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
+import pytest
+
 from execution.decision_engine import (
     NUMERIC_10,
+    _normalize_aware_timestamp,
     deterministic_decision,
     normalize_decimal,
+    normalize_timestamp,
     normalize_token,
     stable_hash,
     stable_uuid,
@@ -51,3 +55,56 @@ def test_deterministic_decision_changes_with_input_hashes() -> None:
     result_a = deterministic_decision("1" * 64, "2" * 64, "3" * 64, "4" * 64, "5" * 64)
     result_b = deterministic_decision("9" * 64, "2" * 64, "3" * 64, "4" * 64, "5" * 64)
     assert result_a.decision_hash != result_b.decision_hash
+
+
+@pytest.mark.parametrize(
+    ("prediction_hash", "expected"),
+    [
+        (
+            "0" * 64,
+            ("d7718c038b851a993eb06d4763b1cf4328fc03d5f422e5e62cbe73d18e591382", "HOLD", "FLAT", "0.7017000000", "0E-10"),
+        ),
+        (
+            "1" * 64,
+            ("0f6a793e6ef5edbde22f0c26e0a0abd2be4ba64ff67e42cfa508ee67471fa612", "EXIT", "FLAT", "0.2765000000", "0E-10"),
+        ),
+        (
+            "9" * 64,
+            (
+                "48c86bb40d58297f792bb6e8fcbedf9302637673346e9964817cc7bf47df8253",
+                "ENTER",
+                "LONG",
+                "0.9503000000",
+                "0.0151000000",
+            ),
+        ),
+    ],
+)
+def test_deterministic_decision_matches_golden_outputs(prediction_hash: str, expected: tuple[str, ...]) -> None:
+    result = deterministic_decision(prediction_hash, "2" * 64, "3" * 64, "4" * 64, "5" * 64)
+    decision_hash, action, direction, confidence, position_size_fraction = expected
+    assert result.decision_hash == decision_hash
+    assert result.decision_hash == stable_hash(
+        ("phase_1d_decision_v1", prediction_hash, "2" * 64, "3" * 64, "4" * 64, "5" * 64)
+    )
+    assert (result.action, result.direction) == (action, direction)
+    assert str(result.confidence) == confidence
+    assert str(result.position_size_fraction) == position_size_fraction
+
+
+def test_normalize_timestamp_caches_equal_instants_across_timezones() -> None:
+    hour = datetime(2026, 1, 1, 5, tzinfo=timezone.utc)
+    same_instant = hour.astimezone(timezone(timedelta(hours=-5)))
+    _normalize_aware_timestamp.cache_clear()
+    assert normalize_timestamp(hour) == "2026-01-01T05:00:00Z"
+    assert normalize_timestamp(same_instant) == "2026-01-01T05:00:00Z"
+    assert _normalize_aware_timestamp.cache_info().hits == 1
+
+
+def test_normalize_timestamp_does_not_cache_naive_values() -> None:
+    naive = datetime(2026, 1, 1, 5)
+    _normalize_aware_timestamp.cache_clear()
+    expected = naive.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    assert normalize_timestamp(naive) == expected
+    assert normalize_timestamp(naive) == expected
+    assert _normalize_aware_timestamp.cache_info().currsize == 0
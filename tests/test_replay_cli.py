@@ -42,6 +42,9 @@ class _FakeCursor:
     def execute(self, sql: str, params: Any = None) -> None:
         self._conn.executed.append((sql, params, self._row_factory))
 
+    def executemany(self, sql: str, params_seq: Any) -> None:
+        self._conn.executed.append((sql, params_seq, self._row_factory))
+
     def fetchall(self) -> list[dict[str, Any]]:
         return list(self._conn.fetchall_rows)
 
@@ -94,6 +97,8 @@ def test_import_main_guard_branch_executes(monkeypatch: pytest.MonkeyPatch) -> N
 def test_convert_named_params_and_parse_hour_ts() -> None:
     cli = _load_cli_module("replay_cli_mod_parse")
     assert cli._convert_named_params("x=:x AND y=:y AND z::int=1") == "x=%(x)s AND y=%(y)s AND z::int=1"
+    assert cli._convert_named_params("x=:x AND y=:y AND z::int=1") == "x=%(x)s AND y=%(y)s AND z::int=1"
+    assert cli._convert_named_params.cache_info().hits == 1
 
     parsed = cli._parse_hour_ts("2026-01-01T12:00:00Z")
     assert parsed.isoformat() == "2026-01-01T12:00:00+00:00"
@@ -132,6 +137,9 @@ def test_psycopg_runtime_db_adapter_paths() -> None:
     db.execute("UPDATE x SET y = :y WHERE z = :z", {"y": 3, "z": 4})
     assert conn.executed[-1][0] == "UPDATE x SET y = %(y)s WHERE z = %(z)s"
 
+    db.execute_many("INSERT INTO x (y) VALUES (:y)", [{"y": 1}, {"y": 2}])
+    assert conn.executed[-1][:2] == ("INSERT INTO x (y) VALUES (%(y)s)", [{"y": 1}, {"y": 2}])
+
 
 def test_resolve_connection_uses_dsn(monkeypatch: pytest.MonkeyPatch) -> None:
     cli = _load_cli_module("replay_cli_mod_conn_dsn")
@@ -591,6 +591,10 @@ class _FakeDB:
             return
         raise RuntimeError(f"Unhandled execute SQL: {sql}")
 
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        for params in params_seq:
+            self.execute(sql, params)
+
 
 def test_execute_and_replay_have_zero_mismatch() -> None:
     db = _FakeDB()
@@ -273,6 +273,10 @@ class _FakeDB:
     def execute(self, sql: str, params: Mapping[str, Any]) -> None:
         self.executed.append((sql, params))
 
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        for params in params_seq:
+            self.execute(sql, params)
+
 
 def test_writer_builds_deterministic_signal_order_and_event_rows() -> None:
     db = _FakeDB()
@@ -319,6 +323,17 @@ def test_writer_builds_deterministic_signal_order_and_event_rows() -> None:
     )
     assert event_a.row_hash == event_b.row_hash
 
+    writer.insert_trade_signals(())
+    writer.insert_risk_events(())
+    assert db.executed == []
+    writer.insert_trade_signals((signal_a,))
+    writer.insert_risk_events((event_a,))
+    assert len(db.executed) == 2
+    assert "INSERT INTO trade_signal" in db.executed[0][0]
+    assert db.executed[0][1]["row_hash"] == signal_a.row_hash
+    assert "INSERT INTO risk_event" in db.executed[1][0]
+    assert db.executed[1][1]["row_hash"] == event_a.row_hash
+
 
 def test_writer_ledger_continuity_violation_aborts() -> None:
     db = _FakeDB()
@@ -5,6 +5,9 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+import pytest
+from sqlalchemy import PrimaryKeyConstraint, UniqueConstraint
+
 import backend.db.models  # noqa: F401  # Ensure all mapped classes are registered.
 from backend.db.base import Base
 
@@ -66,3 +69,57 @@ def test_orm_tables_and_columns_match_canonical_schema_contract() -> None:
         "Canonical schema/ORM column mismatches detected: "
         f"{column_mismatches}"
     )
+
+
+def test_order_book_spread_bps_is_derived_by_view_not_stored() -> None:
+    """spread_bps is computed at read time from the stored spread_abs column."""
+
+    sql = Path("schema_bootstrap.sql").read_text(encoding="utf-8")
+    view = re.search(r"CREATE VIEW public\.v_order_book_snapshot AS\n(.*?);", sql, re.S)
+
+    assert view is not None
+    assert "AS spread_bps" in view.group(1)
+    assert "FROM public.order_book_snapshot" in view.group(1)
+    assert "spread_bps" not in Base.metadata.tables["order_book_snapshot"].columns
+
+
+@pytest.mark.parametrize("table_name", ["portfolio_hourly_state", "position_hourly_state", "risk_hourly_state"])
+def test_hourly_state_run_context_lineage_uses_single_account_hour_fk(table_name: str) -> None:
+    """The account-hour FK implies the (run, mode, hour) key, so no narrower FK is maintained."""
+
+    sql = Path("schema_bootstrap.sql").read_text(encoding="utf-8")
+    run_context_fks = re.findall(
+        rf"^ALTER TABLE ONLY public\.{table_name}\n    ADD CONSTRAINT (\w+) FOREIGN KEY \(([^)]*)\) "
+        r"REFERENCES public\.run_context\(.*\) ON UPDATE RESTRICT ON DELETE RESTRICT;$",
+        sql,
+        re.MULTILINE,
+    )
+    assert run_context_fks == [
+        (f"fk_{table_name}_run_context_account_hour", "source_run_id, account_id, run_mode, hour_ts_utc")
+    ]
+
+    orm_fks = [
+        constraint.name
+        for constraint in Base.metadata.tables[table_name].foreign_key_constraints
+        if constraint.referred_table.name == "run_context"
+    ]
+    assert orm_fks == [f"fk_{table_name}_run_context_account_hour"]
+
+
+def test_run_context_key_constraints_match_canonical_schema() -> None:
+    """The single RunContext model declares exactly the bootstrap PK and unique keys that lineage FKs target."""
+    sql = Path("schema_bootstrap.sql").read_text(encoding="utf-8")
+    ddl_keys = {
+        name: tuple(column.strip() for column in columns.split(","))
+        for name, columns in re.findall(
+            r"ALTER TABLE ONLY public\.run_context\n    ADD CONSTRAINT (\w+) (?:PRIMARY KEY|UNIQUE) \(([^)]*)\);",
+            sql,
+        )
+    }
+    orm_keys = {
+        str(constraint.name): tuple(column.name for column in constraint.columns)
+        for constraint in Base.metadata.tables["run_context"].constraints
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+    }
+    assert ddl_keys["pk_run_context"] == ("run_id",)
+    assert orm_keys == ddl_keys
@@ -0,0 +1,235 @@
+"""Index contract checks between ORM metadata and the canonical bootstrap schema."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import re
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+import backend.db.models  # noqa: F401  # Ensure all mapped classes are registered.
+from backend.db.base import Base
+
+
+ROOT = Path(__file__).resolve().parents[1]
+BOOTSTRAP_PATH = ROOT / "schema_bootstrap.sql"
+
+
+def _orm_index_ddl(table_name: str, index_name: str) -> str:
+    table = Base.metadata.tables[table_name]
+    matches = [index for index in table.indexes if index.name == index_name]
+    assert len(matches) == 1, f"Expected ORM index {index_name} on {table_name}."
+    return str(CreateIndex(matches[0]).compile(dialect=postgresql.dialect()))
+
+
+def _bootstrap_index_ddl(index_name: str) -> str:
+    sql = BOOTSTRAP_PATH.read_text(encoding="utf-8")
+    match = re.search(rf"^CREATE (?:UNIQUE )?INDEX {index_name} ON .*;$", sql, flags=re.MULTILINE)
+    assert match is not None, f"Expected canonical index {index_name} in schema_bootstrap.sql."
+    return match.group(0)
+
+
+@pytest.mark.parametrize(
+    ("table_name", "orm_index_name", "bootstrap_index_name", "include_columns"),
+    [
+        (
+            "model_prediction",
+            "uqix_model_prediction_meta_per_run_asset_horizon_hour",
+            "model_prediction_v2_run_id_asset_id_horizon_hour_ts_utc_idx",
+            "prob_up, expected_return, model_version_id",
+        ),
+        (
+            "feature_snapshot",
+            "idx_feature_snapshot_asset_hour_desc",
+            "idx_feature_snapshot_asset_hour_desc",
+            "feature_value",
+        ),
+        (
+            "model_version",
+            "uqix_model_version_one_active_per_name_role",
+            "uqix_model_version_one_active_per_name_role",
+            "model_version_id, mlflow_model_uri, mlflow_run_id, feature_set_version, hyperparams_hash, training_data_hash",
+        ),
+        (
+            "model_activation_gate",
+            "uqix_model_activation_gate_one_approved",
+            "uqix_model_activation_gate_one_approved",
+            "activation_id, validation_backtest_run_id, validation_window_end_utc, approval_hash",
+        ),
+        (
+            "model_version",
+            "idx_model_version_active_by_role",
+            "idx_model_version_active_by_role",
+            "model_version_id, model_name",
+        ),
+        (
+            "model_prediction",
+            "idx_model_prediction_asset_horizon_hour",
+            "idx_model_prediction_asset_horizon_hour",
+            "prob_up, expected_return, model_role, model_version_id",
+        ),
+        (
+            "meta_learner_component",
+            "idx_meta_component_asset_horizon_hour",
+            "idx_meta_component_asset_horizon_hour",
+            "base_prob_up, component_weight",
+        ),
+    ],
+)
+def test_covering_indexes_match_canonical_schema(
+    table_name: str,
+    orm_index_name: str,
+    bootstrap_index_name: str,
+    include_columns: str,
+) -> None:
+    """Covering indexes must carry identical INCLUDE payloads in ORM and bootstrap DDL."""
+    assert f"INCLUDE ({include_columns})" in _orm_index_ddl(table_name, orm_index_name)
+    assert f"INCLUDE ({include_columns})" in _bootstrap_index_ddl(bootstrap_index_name)
+
+
+@pytest.mark.parametrize(
+    ("table_name", "index_name"),
+    [
+        ("market_ohlcv_hourly", "brin_market_ohlcv_hour"),
+        ("order_book_snapshot", "brin_order_book_hour"),
+        ("feature_snapshot", "brin_feature_snapshot_hour"),
+        ("regime_output", "brin_regime_output_hour"),
+        ("model_prediction", "brin_model_prediction_hour"),
+        ("portfolio_hourly_state", "brin_portfolio_hourly_hour"),
+        ("position_hourly_state", "brin_position_hourly_hour"),
+        ("risk_hourly_state", "brin_risk_hourly_hour"),
+        ("cluster_exposure_hourly_state", "brin_cluster_exposure_hourly_hour"),
+    ],
+)
+def test_time_range_brin_indexes_match_canonical_schema(table_name: str, index_name: str) -> None:
+    """Append-only hourly tables serve pure time-range scans from BRIN, not a full time-only btree."""
+    expected = "USING brin (hour_ts_utc) WITH (pages_per_range = 32)"
+    assert expected in _orm_index_ddl(table_name, index_name)
+    assert "USING brin (hour_ts_utc) WITH (pages_per_range='32')" in _bootstrap_index_ddl(index_name)
+
+    time_only_btree = re.compile(rf"ON {table_name} \(hour_ts_utc(?: DESC)?\)$")
+    for index in Base.metadata.tables[table_name].indexes:
+        assert not time_only_btree.search(_orm_index_ddl(table_name, str(index.name)))
+
+
+def test_model_version_role_lookup_uses_only_the_active_partial_index() -> None:
+    """Active-by-role lookups read the partial covering index; no full (model_role, is_active) btree is kept."""
+    index_names = {index.name for index in Base.metadata.tables["model_version"].indexes}
+    assert "idx_model_version_active_by_role" in index_names
+    assert "idx_model_version_role_active" not in index_names
+    assert "idx_model_version_role_active" not in BOOTSTRAP_PATH.read_text(encoding="utf-8")
+
+
+def test_feature_snapshot_primary_key_leads_with_series_identity() -> None:
+    """The PK groups one (asset, feature) series by hour so range scans stay on a single btree path."""
+    columns = [column.name for column in Base.metadata.tables["feature_snapshot"].primary_key.columns]
+    assert columns == ["asset_id", "feature_id", "hour_ts_utc", "run_id"]
+    assert (
+        "ADD CONSTRAINT pk_feature_snapshot PRIMARY KEY (asset_id, feature_id, hour_ts_utc, run_id);"
+        in BOOTSTRAP_PATH.read_text(encoding="utf-8")
+    )
+
+
+def test_market_ohlcv_hourly_is_clustered_on_asset_major_primary_key() -> None:
+    """CLUSTER/reorder passes lay each asset's candles out contiguously in PK order."""
+    sql = BOOTSTRAP_PATH.read_text(encoding="utf-8")
+    assert "ALTER TABLE public.market_ohlcv_hourly CLUSTER ON pk_market_ohlcv_hourly;" in sql
+    assert "PRIMARY KEY (asset_id, hour_ts_utc, source_venue);" in sql
+
+
+def test_pending_gap_index_serves_repair_scan_index_only() -> None:
+    """The repair loop reads PENDING gaps ordered by detection time; the partial index holds exactly that workset."""
+    ddl = _bootstrap_index_ddl("idx_data_gap_event_pending")
+    assert "ON public.data_gap_event USING btree (detected_at_utc)" in ddl
+    assert "INCLUDE (gap_event_id, symbol, gap_start_ts_utc, gap_end_ts_utc)" in ddl
+    assert ddl.endswith("WHERE (status = 'PENDING'::text);")
+
+
+@pytest.mark.parametrize(
+    ("index_name", "flag_column"),
+    [
+        ("idx_risk_hourly_kill_switch_true_hour_desc", "kill_switch_active"),
+        ("idx_risk_hourly_manual_review_true_hour_desc", "requires_manual_review"),
+    ],
+)
+def test_risk_flag_partial_indexes_match_canonical_schema(index_name: str, flag_column: str) -> None:
+    """Halted-account probes read a partial index holding only the flagged account-hours."""
+    orm_ddl = _orm_index_ddl("risk_hourly_state", index_name)
+    assert "ON risk_hourly_state (account_id, hour_ts_utc DESC)" in orm_ddl
+    assert orm_ddl.endswith(f"WHERE {flag_column} = TRUE")
+    assert _bootstrap_index_ddl(index_name).endswith(
+        f"ON public.risk_hourly_state USING btree (account_id, hour_ts_utc DESC) WHERE ({flag_column} = true);"
+    )
+
+
+def test_trade_signal_action_index_skips_hold_signals() -> None:
+    """Only ENTER/EXIT signals feed order routing; HOLD rows stay out of the action index."""
+    assert _orm_index_ddl("trade_signal", "idx_trade_signal_enter_exit_hour_desc").endswith(
+        "ON trade_signal (action, hour_ts_utc DESC) WHERE action IN ('ENTER', 'EXIT')"
+    )
+    assert _bootstrap_index_ddl("idx_trade_signal_enter_exit_hour_desc").endswith(
+        "ON public.trade_signal USING btree (action, hour_ts_utc DESC) "
+        "WHERE (action = ANY (ARRAY['ENTER'::public.signal_action_enum, 'EXIT'::public.signal_action_enum]));"
+    )
+    assert "trade_signal_v2_action_hour_ts_utc_idx" not in BOOTSTRAP_PATH.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    ("index_name", "expected"),
+    [
+        (
+            "idx_ingestion_cycle_started_desc",
+            "ON public.ingestion_cycle USING btree (started_at_utc DESC) INCLUDE (ingestion_cycle_id);",
+        ),
+        (
+            "idx_training_cycle_kind_started_desc",
+            "ON public.training_cycle USING btree (cycle_kind, started_at_utc DESC);",
+        ),
+        (
+            "idx_automation_event_type_ts_desc",
+            "ON public.automation_event_log USING btree (event_type, event_ts_utc DESC) INCLUDE (status);",
+        ),
+    ],
+)
+def test_daemon_cycle_status_probes_are_indexed(index_name: str, expected: str) -> None:
+    """Daemon status and retrain cooldown probes must not scan full cycle history."""
+    assert _bootstrap_index_ddl(index_name).endswith(expected)
+
+
+def test_latest_watermark_lookup_is_index_only() -> None:
+    """Cycle-start watermark probes filter on watermark_kind and read cursor/count from the index."""
+    ddl = _bootstrap_index_ddl("idx_ingestion_watermark_symbol_ts_desc")
+    assert "(source_name, symbol, watermark_ts_utc DESC)" in ddl
+    assert ddl.endswith("INCLUDE (watermark_kind, watermark_cursor, records_ingested);")
+
+
+@pytest.mark.parametrize(
+    ("index_name", "table_name", "column_name"),
+    [
+        ("brin_drift_event_triggered", "drift_event", "triggered_at_utc"),
+        ("brin_hindcast_forecast_metric_measured", "hindcast_forecast_metric", "measured_at_utc"),
+    ],
+)
+def test_phase6_event_time_windows_use_brin(index_name: str, table_name: str, column_name: str) -> None:
+    """Append-only Phase 6 event tables serve time-window scans from BRIN."""
+    assert _bootstrap_index_ddl(index_name).endswith(
+        f"ON public.{table_name} USING brin ({column_name}) WITH (pages_per_range='32');"
+    )
+
+
+@pytest.mark.parametrize(
+    ("table_name", "index_name", "column_name"),
+    [
+        ("model_activation_gate", "idx_model_activation_gate_model_version", "model_version_id"),
+        ("model_training_window", "idx_model_training_window_model_version", "model_version_id"),
+        ("ingestion_watermark_history", "idx_ingestion_watermark_cycle", "ingestion_cycle_id"),
+        ("raw_trade_chunk_manifest", "idx_raw_trade_chunk_cycle", "ingestion_cycle_id"),
+    ],
+)
+def test_restrict_foreign_keys_have_supporting_indexes(table_name: str, index_name: str, column_name: str) -> None:
+    """ON DELETE RESTRICT probes and parent-to-child joins must not seqscan the child table."""
+    assert _bootstrap_index_ddl(index_name).endswith(f"ON public.{table_name} USING btree ({column_name});")
+    if index_name in {index.name for index in Base.metadata.tables[table_name].indexes}:
+        assert f"ON {table_name} ({column_name})" in _orm_index_ddl(table_name, index_name)
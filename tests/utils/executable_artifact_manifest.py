@@ -23,6 +23,9 @@ SQL_EXECUTE_SET: frozenset[str] = frozenset(
         "docs/validations/TEST_RUNTIME_INSERT_ENABLE.sql",
         "docs/repairs/PHASE_1C_REVISION_C_SCHEMA_REPAIR_BLUEPRINT.sql",
         "docs/repairs/PHASE_1C_REVISION_C_TRIGGER_REPAIR.sql",
+        "docs/repairs/HOURLY_STATE_RUN_CONTEXT_FK_REPAIR.sql",
+        "docs/repairs/ORDER_BOOK_SPREAD_BPS_VIEW_REPAIR.sql",
+        "docs/repairs/FEATURE_SNAPSHOT_PRIMARY_KEY_REPAIR.sql",
     }
 )
 
@@ -58,6 +58,11 @@ class PsycopgRuntimeDB:
         with self.conn.cursor() as cur:
             cur.execute(converted, dict(params))
 
+    def execute_many(self, sql: str, params_seq: Sequence[Mapping[str, Any]]) -> None:
+        converted = _convert_named_params(sql)
+        with self.conn.cursor() as cur:
+            cur.executemany(converted, [dict(params) for params in params_seq])
+
 
 def deterministic_uuid(seed: str) -> UUID:
     """Generate deterministic UUID for test fixtures."""